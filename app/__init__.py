@@ -5,11 +5,40 @@ This module provides the create_app() function following the Flask app factory p
 enabling flexible application initialization with configuration management and blueprint registration.
 """
 
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 import sys
 from flask import Flask
 
 
+def _attach_queue_listener(handler: logging.Handler) -> logging.Handler:
+    """
+    Move a log handler behind a background QueueListener.
+
+    Request threads only enqueue records on a lock-free SimpleQueue; formatting
+    and the stream write happen on the listener thread, so log I/O never blocks
+    or serializes request handling.
+
+    Args:
+        handler (logging.Handler): Handler that performs the actual output
+
+    Returns:
+        logging.Handler: QueueHandler to attach to the root logger
+    """
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    # Threads do not survive fork(): with Gunicorn preload_app the listener is started
+    # in the master, so each worker must start its own listener thread after forking
+    if hasattr(os, 'register_at_fork'):
+        os.register_at_fork(after_in_child=listener.start)
+    return logging.handlers.QueueHandler(log_queue)
+
+
 def create_app(config_name=None):
     """
     Create and configure Flask application instance.
@@ -26,45 +55,39 @@ def create_app(config_name=None):
     # Load configuration
     from app.config import Config
     app.config.from_object(Config)
+    # Let Werkzeug enforce the size limit at the WSGI layer (raises 413 on read)
+    app.config['MAX_CONTENT_LENGTH'] = Config.MAX_REQUEST_SIZE
 
     # Configure logging
     # Production uses structured JSON logging, development uses human-readable format
     if Config.DEPLOYMENT_STAGE == 'production':
-        import json
-        from datetime import datetime, timezone
-        
-        class StructuredJSONFormatter(logging.Formatter):
-            """JSON formatter for structured logging in production."""
-            def format(self, record):
-                log_entry = {
-                    'timestamp': datetime.now(timezone.utc).isoformat(),
-                    'level': record.levelname,
-                    'logger': record.name,
-                    'message': record.getMessage()
-                }
-                # Add context if available (from extra dict)
-                if hasattr(record, 'context') and record.context:
-                    log_entry['context'] = record.context
-                if hasattr(record, 'endpoint') and record.endpoint:
-                    log_entry['endpoint'] = record.endpoint
-                if hasattr(record, 'file_size') and record.file_size:
-                    log_entry['file_size'] = record.file_size
-                return json.dumps(log_entry)
-        
+        from app.logging_json import StructuredJSONFormatter
+
         handler = logging.StreamHandler(sys.stdout)
         handler.setFormatter(StructuredJSONFormatter())
+        # basicConfig is a no-op once the root logger has handlers, so only start
+        # a listener the first time the factory configures logging
+        if not logging.getLogger().handlers:
+            handler = _attach_queue_listener(handler)
         logging.basicConfig(
             level=Config.LOG_LEVEL_VALUE,
             handlers=[handler],
             format='%(message)s'  # JSON formatter handles the format
         )
+        # Werkzeug's per-request INFO lines duplicate the application's request logging
+        logging.getLogger('werkzeug').setLevel(logging.WARNING)
     else:
-        # Development: Human-readable format
+        # Development: Human-readable format; structured payloads become key=value pairs
+        from app.logging_json import KeyValueFormatter
+
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(KeyValueFormatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s%(payload_text)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        ))
         logging.basicConfig(
             level=Config.LOG_LEVEL_VALUE,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            stream=sys.stdout,
-            datefmt='%Y-%m-%d %H:%M:%S'
+            handlers=[handler]
         )
     
     app.logger.setLevel(Config.LOG_LEVEL_VALUE)
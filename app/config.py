@@ -9,6 +9,24 @@ import os
 from logging import INFO, DEBUG
 
 
+def _resolve_gunicorn_workers(value: str, max_workers: int) -> int:
+    """
+    Resolve the Gunicorn worker count from its environment value.
+
+    Args:
+        value (str): Raw GUNICORN_WORKERS value; 'auto' (or empty) sizes the pool
+            from the CPU count, anything else is used as an explicit integer
+        max_workers (int): Upper bound applied to the automatic size
+
+    Returns:
+        int: Number of worker processes
+    """
+    if not value or value.strip().lower() == 'auto':
+        # Gunicorn's recommended formula, capped to avoid context-switch thrash on large hosts
+        return min(2 * (os.cpu_count() or 1) + 1, max_workers)
+    return int(value)
+
+
 class Config:
     """
     Application configuration class.
@@ -32,6 +50,10 @@ class Config:
     # Convert string log level to logging constant
     LOG_LEVEL_VALUE = DEBUG if LOG_LEVEL.upper() == 'DEBUG' else INFO
 
+    # Add process RSS before/after each conversion to the success log entry.
+    # Requires psutil; off by default since each reading is a /proc syscall.
+    MEMORY_PROFILING_ENABLED = os.environ.get('MEMORY_PROFILING_ENABLED', 'false').lower() == 'true'
+
     # Flask configuration
     SECRET_KEY = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
     
@@ -39,11 +61,26 @@ class Config:
     DEPLOYMENT_STAGE = os.environ.get('DEPLOYMENT_STAGE', 'development').lower()
     
     # Gunicorn configuration (used by gunicorn_config.py)
-    GUNICORN_WORKERS = int(os.environ.get('GUNICORN_WORKERS', 4))
+    # Workers default to 'auto': (2 * CPU count) + 1, capped at GUNICORN_WORKERS_MAX
+    GUNICORN_WORKERS_MAX = int(os.environ.get('GUNICORN_WORKERS_MAX', 16))
+    GUNICORN_WORKERS = _resolve_gunicorn_workers(os.environ.get('GUNICORN_WORKERS', 'auto'), GUNICORN_WORKERS_MAX)
     GUNICORN_WORKER_CLASS = os.environ.get('GUNICORN_WORKER_CLASS', 'sync')
+    # Threads per worker; values > 1 make Gunicorn use the gthread worker so slow
+    # uploads (socket reads) of several requests overlap within one process
+    GUNICORN_THREADS = int(os.environ.get('GUNICORN_THREADS', 1))
     GUNICORN_TIMEOUT = int(os.environ.get('GUNICORN_TIMEOUT', 120))
     GUNICORN_GRACEFUL_TIMEOUT = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
     GUNICORN_MAX_REQUESTS = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000))
+    GUNICORN_MAX_REQUESTS_JITTER = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', 100))
     GUNICORN_LOG_LEVEL = os.environ.get('GUNICORN_LOG_LEVEL', 'info').lower()
     GUNICORN_BIND = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')
+    
+    # Preload the application in the Gunicorn master before forking workers.
+    # Workers then share the imported Flask/lxml/service modules via copy-on-write
+    # pages instead of each importing them independently.
+    GUNICORN_PRELOAD_APP = os.environ.get('GUNICORN_PRELOAD_APP', 'true').lower() == 'true'
+
+    # Disable Gunicorn's per-request access log. Every conversion request is already
+    # logged by the application (request received + structured success/error entry).
+    DISABLE_ACCESS_LOG = os.environ.get('DISABLE_ACCESS_LOG', 'true').lower() == 'true'
 
@@ -44,6 +44,16 @@ class XMLValidationError(Exception):
         super().__init__(error_msg)
 
 
+class XPathEvaluationError(XMLValidationError):
+    """
+    Exception raised when an XPath expression cannot be compiled or evaluated.
+
+    Subclass of XMLValidationError, so callers that handle conversion failures
+    generically keep working; the XPath endpoint catches it first to report an
+    XPath failure instead of an XML parse error.
+    """
+
+
 class FileSizeExceededError(Exception):
     """
     Exception raised when request body size exceeds the maximum allowed limit.
@@ -6,12 +6,22 @@ including the health check endpoint.
 """
 
 import logging
+import os
 import time
-import json
-from flask import Blueprint, jsonify, request, Response
-from app.services.json_converter import convert_xml_string_to_json
-from app.services.csv_converter import convert_xml_string_to_csv, convert_xml_string_to_csv_by_xpath
-from app.exceptions import XMLValidationError
+from dataclasses import dataclass
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from types import MappingProxyType
+from typing import Mapping, Optional
+from flask import Blueprint, current_app, g, request, Response
+from werkzeug.exceptions import HTTPException, RequestEntityTooLarge
+import orjson
+from app.config import Config
+from app.services.json_converter import convert_xml_string_to_json, convert_xml_stream_to_json
+from app.services.csv_converter import (
+    convert_xml_to_csv_chunks, convert_xml_to_csv_chunks_by_xpath, compile_xpath
+)
+from app.exceptions import XMLValidationError, XPathEvaluationError, FileSizeExceededError
 from app.utils.validators import (
     format_content_type_error,
     format_xml_validation_error,
@@ -20,186 +30,573 @@ from app.utils.validators import (
     EMPTY_REQUEST_BODY,
     REQUEST_READ_ERROR,
     format_error_response,
+    format_static_error_response,
     validate_request_size
 )
-from app.exceptions import FileSizeExceededError
 
 logger = logging.getLogger(__name__)
 convert_bp = Blueprint('convert', __name__)
 
+# Bodies larger than this (per Content-Length) are parsed directly from the request stream
+STREAM_BODY_THRESHOLD = 1024 * 1024  # 1MB
 
-@convert_bp.route('/health', methods=['GET'])
-def health_check():
+# Accepted request media types (parameters such as charset are ignored)
+_XML_CONTENT_TYPES = frozenset({'application/xml', 'text/xml'})
+
+# Pre-serialized health check payload (probed every few seconds by orchestrators)
+_HEALTH_BODY = b'{"status":"healthy"}'
+_HEALTH_HEADERS = {'Content-Type': 'application/json'}
+
+# Optional memory instrumentation - psutil is not a hard dependency. Reading RSS
+# opens /proc on every call, so psutil is only loaded when profiling is switched on
+# (MEMORY_PROFILING_ENABLED).
+_PROC = None
+if Config.MEMORY_PROFILING_ENABLED:
+    try:
+        import psutil
+        _PROC = psutil.Process()
+    except ImportError:
+        pass
+
+
+def _reset_process_handle():
+    """Re-create the cached psutil handle in a forked child (it stores the creating pid)."""
+    global _PROC
+    _PROC = psutil.Process()
+
+
+if _PROC is not None and hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_process_handle)
+
+
+def _rss_mb():
     """
-    Health check endpoint.
+    Return the current process RSS in MB for debug instrumentation.
 
-    Returns a simple JSON status response for monitoring and orchestration
-    platforms (Kubernetes, ECS, etc.).
+    The process handle only exists when memory instrumentation is enabled
+    (MEMORY_PROFILING_ENABLED), so this is a single check otherwise.
 
     Returns:
-        tuple: JSON response and HTTP status code (200 OK)
+        float or None: Resident set size in MB, or None when not measured
     """
-    return jsonify({"status": "healthy"}), 200
+    if _PROC is None:
+        return None
+    try:
+        return _PROC.memory_info().rss / (1024 * 1024)
+    except Exception:
+        # Any psutil error, skip memory tracking
+        return None
 
 
-@convert_bp.route('/convert/xml-to-json', methods=['POST'])
-def convert_xml_to_json():
+@lru_cache(maxsize=512)
+def _parse_namespaces(namespaces_str: str):
     """
-    POST endpoint for converting XML to JSON.
+    Decode the JSON namespaces query parameter, cached per distinct string.
 
-    Accepts XML data in request body, validates Content-Type header,
-    calls the conversion service, and returns JSON response.
+    The result is shared between requests, so JSON objects are returned as a
+    read-only mapping; a request can't alter the namespaces seen by the next.
+
+    Args:
+        namespaces_str (str): JSON-encoded namespace mapping
 
     Returns:
-        tuple: JSON response and HTTP status code (200 OK on success)
-            or error response with appropriate HTTP status code
+        Any: Read-only mapping for a JSON object, otherwise the decoded value
 
-    Error Responses:
-        - 413 Payload Too Large: Request size exceeds maximum limit (300MB)
-        - 400 Bad Request: Invalid or missing Content-Type header
-        - 400 Bad Request: Malformed XML (XMLValidationError)
-        - 500 Internal Server Error: Unexpected server error
+    Raises:
+        orjson.JSONDecodeError: If the parameter is not valid JSON
     """
-    endpoint = '/convert/xml-to-json'
-    
-    # Log request received
-    content_type = request.headers.get('Content-Type', 'missing')
-    content_length = request.headers.get('Content-Length', 'unknown')
-    logger.info(
-        f"Request received: endpoint={endpoint}, "
-        f"Content-Type={content_type}, Content-Length={content_length}"
+    namespaces = orjson.loads(namespaces_str)
+    if isinstance(namespaces, dict):
+        return MappingProxyType(namespaces)
+    return namespaces
+
+
+def _json_response(obj) -> Response:
+    """
+    Build an application/json response for a conversion result.
+
+    orjson serializes large converted documents several times faster than the
+    stdlib encoder behind jsonify() and returns bytes directly. Keys are sorted
+    to match the output of Flask's default JSON provider.
+
+    Args:
+        obj: JSON-serializable conversion result
+
+    Returns:
+        Response: Response with the serialized body and application/json mimetype
+    """
+    return Response(orjson.dumps(obj, option=orjson.OPT_SORT_KEYS), mimetype='application/json')
+
+
+def _csv_response(csv_chunks) -> Response:
+    """
+    Build a streamed text/csv response from CSV text chunks.
+
+    Each chunk is encoded to UTF-8 once here and the response is marked
+    direct_passthrough, so Werkzeug hands the byte chunks to the WSGI server
+    without wrapping the iterable in its own encoding layer.
+
+    Args:
+        csv_chunks (Iterator[str]): CSV text chunks from the converter
+
+    Returns:
+        Response: Streaming response with Content-Type text/csv
+    """
+    response = Response(
+        (chunk.encode('utf-8') for chunk in csv_chunks),
+        mimetype='text/csv',
+        direct_passthrough=True
     )
+    response.headers['Content-Type'] = 'text/csv'
+    return response
+
+
+def _is_xml_content_type(content_type: str) -> bool:
+    """
+    Check whether a Content-Type header names an accepted XML media type.
+
+    Parameters such as "; charset=utf-8" are ignored, and the header is only
+    split and lowercased when the exact value doesn't already match.
+
+    Args:
+        content_type (str): Raw Content-Type header value
+
+    Returns:
+        bool: True if the media type is application/xml or text/xml
+    """
+    # Common case: a bare, lowercase media type matches without any allocation
+    if content_type in _XML_CONTENT_TYPES:
+        return True
+    media_type = content_type.split(';', 1)[0].strip()
+    return media_type in _XML_CONTENT_TYPES or media_type.lower() in _XML_CONTENT_TYPES
+
+
+def _validate_xml_request(endpoint: str):
+    """
+    Run the checks shared by all conversion endpoints before the body is read.
 
-    # Validate request size BEFORE any processing (early rejection to save resources)
+    Logs the received request, rejects oversized requests (413) and requests
+    whose Content-Type is not an XML media type (400).
+
+    Args:
+        endpoint (str): Endpoint path used in log messages
+
+    Returns:
+        tuple or None: Error response and status code, or None if the request
+            may proceed
+    """
+    content_type = request.headers.get('Content-Type', 'missing')
+    # Checked against the configured logger: the header lookups are skipped when
+    # INFO is disabled, and the message is %-formatted only if it is emitted
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Request received: endpoint=%s, Content-Type=%s, Content-Length=%s",
+            endpoint, content_type, request.headers.get('Content-Length', 'unknown'),
+            extra={'endpoint': endpoint}
+        )
+
+    # Validate request size BEFORE any processing (early rejection to save resources).
+    # This is the single 413 decision for declared sizes: MAX_FILE_SIZE, or the
+    # deployment's MAX_REQUEST_SIZE when that is lower
     try:
-        validate_request_size(request)
+        validate_request_size(request, min(Config.MAX_FILE_SIZE, current_app.config['MAX_REQUEST_SIZE']))
     except FileSizeExceededError as e:
         logger.warning(
-            f"Request size exceeded limit: endpoint={endpoint}, "
-            f"max_size={e.max_size_bytes}, actual_size={e.actual_size_bytes}"
+            "Request size exceeded limit: endpoint=%s, max_size=%s, actual_size=%s",
+            endpoint, e.max_size_bytes, e.actual_size_bytes
         )
         # Return HTTP 413 (Payload Too Large) with structured error format
         return format_file_size_error(max_size_mb=300)
 
     # Validate Content-Type header
-    content_type_lower = content_type.lower()
-    if content_type_lower not in ['application/xml', 'text/xml']:
+    if not _is_xml_content_type(content_type):
         logger.warning(
-            f"Content-Type validation failed: endpoint={endpoint}, "
-            f"received={content_type}"
+            "Content-Type validation failed: endpoint=%s, received=%s",
+            endpoint, content_type
         )
         return format_content_type_error(content_type)
 
-    # Extract XML string from request body
+    return None
+
+
+def _read_body(endpoint: str, whitespace_is_empty: bool = False):
+    """
+    Read the XML request body for a conversion endpoint.
+
+    Large bodies with a known length (over STREAM_BODY_THRESHOLD) are not read
+    here: they are parsed straight from request.stream, so parsing overlaps
+    with the upload and the body is never buffered as a whole. Other bodies
+    are read once as raw bytes, which lxml parses directly.
+
+    Args:
+        endpoint (str): Endpoint path used in log messages
+        whitespace_is_empty (bool): Also reject a body of only whitespace as empty
+
+    Returns:
+        tuple: (xml_bytes, file_size_bytes, None) on success - xml_bytes is None
+            when the body is to be parsed from request.stream - or
+            (None, None, error response) for an empty or unreadable body
+
+    Raises:
+        RequestEntityTooLarge: If a body without Content-Length runs past the
+            size limit (answered by handle_request_entity_too_large)
+    """
+    if (request.content_length or 0) > STREAM_BODY_THRESHOLD:
+        return None, request.content_length, None
+
     try:
-        xml_string = request.get_data(as_text=True)
-        if not xml_string:
-            logger.warning(
-                f"Empty request body: endpoint={endpoint}"
-            )
-            return format_error_response(
-                code=EMPTY_REQUEST_BODY,
-                message="Request body is empty",
-                details="XML content is required in the request body",
-                status_code=400
-            )
+        # cache=False: don't keep Werkzeug's copy alive; the body is never decoded to str
+        xml_bytes = request.get_data(cache=False)
+    except RequestEntityTooLarge:
+        raise
     except Exception as e:
-        logger.error(
-            f"Failed to read request body: endpoint={endpoint}, "
-            f"error={str(e)}",
-            exc_info=True
+        # Client-side read failures (dropped connection, bad chunked encoding) are
+        # expected under flaky networks: log without capturing a traceback
+        logger.warning(
+            "Failed to read request body: endpoint=%s, error=%s: %s",
+            endpoint, type(e).__name__, e,
+            extra={'endpoint': endpoint}
         )
-        return format_error_response(
+        return None, None, format_error_response(
             code=REQUEST_READ_ERROR,
             message="Failed to read request body",
             details=str(e),
             status_code=400
         )
 
+    # isspace() scans without copying and stops at the first non-whitespace byte
+    if not xml_bytes or (whitespace_is_empty and xml_bytes.isspace()):
+        logger.warning(
+            "Empty request body: endpoint=%s", endpoint
+        )
+        return None, None, format_static_error_response(
+            code=EMPTY_REQUEST_BODY,
+            message="Request body is empty",
+            details="XML content is required in the request body",
+            status_code=400
+        )
+    return xml_bytes, len(xml_bytes), None
+
+
+@contextmanager
+def _perf_trace(endpoint: str, **fields):
+    """
+    Measure a conversion and log its metrics when it completes successfully.
+
+    Records the monotonic start time (and RSS when memory profiling
+    is enabled) on entry. On normal exit adds processing_ms, status and memory
+    figures to the metrics dict and logs it as the "Conversion successful"
+    payload. If the block raises, nothing is logged and the exception propagates
+    to the route's error handling.
+
+    Args:
+        endpoint (str): Endpoint path, first field of the metrics payload
+        **fields: Additional metrics known up front (e.g. file_size_bytes)
+
+    Yields:
+        dict: Mutable metrics dict the caller may add fields to
+    """
+    metrics = {'endpoint': endpoint, **fields}
+    # Only measure and build the metrics payload when the record will be emitted
+    info_on = logger.isEnabledFor(logging.INFO)
+    memory_before = _rss_mb() if info_on else None
+    start_ns = time.perf_counter_ns()
+    yield metrics
+    if not info_on:
+        return
+    # Monotonic clock, integer arithmetic; resolution below 1ms is not useful here
+    processing_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+    metrics['processing_ms'] = processing_ms
+    metrics['status'] = 'success'
+    # Add memory metrics if available
+    if memory_before is not None:
+        memory_after = _rss_mb()
+        if memory_after is not None:
+            metrics['memory_before_mb'] = round(memory_before, 2)
+            metrics['memory_after_mb'] = round(memory_after, 2)
+            metrics['memory_delta_mb'] = round(memory_after - memory_before, 2)
+    # The formatter serializes the payload once; no intermediate string building
+    logger.info("Conversion successful", extra={'payload': metrics})
+
+
+@dataclass(frozen=True)
+class XmlRequestParams:
+    """Validated query parameters of a conversion request (slotted: no per-instance dict).
+
+    Defaults are applied by _parse_request_params(): slotted fields cannot have
+    class-level defaults, and dataclass(slots=True) needs Python 3.10.
+    """
+    __slots__ = ('delimiter', 'xpath', 'namespaces', 'path_separator')
+    delimiter: str
+    xpath: Optional[str]
+    namespaces: Optional[Mapping[str, str]]
+    path_separator: str
+
+
+def _parse_request_params(endpoint: str, csv_options: bool, xpath_options: bool):
+    """
+    Read and validate the query parameters of a conversion request.
+
+    Args:
+        endpoint (str): Endpoint path used in log messages
+        csv_options (bool): Accept the delimiter parameter
+        xpath_options (bool): Require xpath and accept namespaces/path_separator
+
+    Returns:
+        tuple: (XmlRequestParams, None) on success, or (None, error response)
+    """
+    args = request.args
+    values = {'delimiter': ',', 'xpath': None, 'namespaces': None, 'path_separator': '/'}
+
+    if xpath_options:
+        # Extract XPath from query parameters (required)
+        # Try lowercase first, then case-insensitive search
+        xpath = args.get('xpath', '').strip()
+        if not xpath:
+            # Try case-insensitive search for common variations
+            for key in args.keys():
+                if key.lower() == 'xpath':
+                    xpath = args.get(key, '').strip()
+                    break
+
+        if not xpath:
+            logger.warning(
+                "Missing XPath parameter: endpoint=%s", endpoint
+            )
+            return None, format_static_error_response(
+                code="MISSING_XPATH",
+                message="XPath parameter is required",
+                details="Please provide an XPath expression via ?xpath= query parameter (e.g., ?xpath=//item). Send XML content in the request body.",
+                status_code=400
+            )
+        values['xpath'] = xpath
+
+    if csv_options:
+        # Extract delimiter from query parameters (optional, default: comma)
+        delimiter = args.get('delimiter', ',')
+
+        # Validate delimiter is a single character
+        if len(delimiter) != 1:
+            logger.warning(
+                "Invalid delimiter: endpoint=%s, delimiter=%s", endpoint, delimiter
+            )
+            return None, format_error_response(
+                code="INVALID_DELIMITER",
+                message="Delimiter must be a single character",
+                details=f"Received delimiter: {delimiter}. Common options: ',' (comma), ';' (semicolon), '\\t' (tab), '|' (pipe)",
+                status_code=400
+            )
+        values['delimiter'] = delimiter
+
+    if xpath_options:
+        # Extract namespaces from query parameters (optional, JSON-encoded)
+        namespaces_str = args.get('namespaces', '').strip()
+        if namespaces_str:
+            try:
+                namespaces = _parse_namespaces(namespaces_str)
+            except orjson.JSONDecodeError as e:
+                return None, format_error_response(
+                    code="INVALID_NAMESPACES",
+                    message="Invalid JSON in namespaces parameter",
+                    details=str(e),
+                    status_code=400
+                )
+            if not isinstance(namespaces, MappingProxyType):
+                return None, format_static_error_response(
+                    code="INVALID_NAMESPACES",
+                    message="Namespaces must be a valid JSON object",
+                    details="Expected format: {\"prefix\": \"uri\"} (e.g., {\"wd\": \"urn:com.workday/bsvc\"})",
+                    status_code=400
+                )
+            # XPath needs a non-empty prefix and URI string for every mapping
+            if not all(prefix and uri and isinstance(uri, str) for prefix, uri in namespaces.items()):
+                return None, format_static_error_response(
+                    code="INVALID_NAMESPACES",
+                    message="Namespace prefixes and URIs must be non-empty strings",
+                    details="Expected format: {\"prefix\": \"uri\"} (e.g., {\"wd\": \"urn:com.workday/bsvc\"})",
+                    status_code=400
+                )
+            values['namespaces'] = namespaces
+
+        # Extract path separator from query parameters (optional, default: slash)
+        path_separator = args.get('path_separator', '/')
+        # Validate path separator is 1-2 characters (allow for // double slash)
+        if len(path_separator) == 0 or len(path_separator) > 2:
+            logger.warning(
+                "Invalid path separator: endpoint=%s, path_separator=%s", endpoint, path_separator
+            )
+            return None, format_error_response(
+                code="INVALID_PATH_SEPARATOR",
+                message="Path separator must be 1-2 characters",
+                details=f"Received path_separator: {path_separator}. Common options: '/' (slash - default), '//' (double slash), '_' (underscore), '-' (dash), '.' (dot)",
+                status_code=400
+            )
+        values['path_separator'] = path_separator
+
+        # Compile-check the expression before the body is read, so a syntax error
+        # costs no upload or parse. Evaluators are cached: a repeated valid XPath
+        # is a dictionary lookup here and again in the converter.
+        try:
+            compile_xpath(xpath, values.get('namespaces'))
+        except XMLValidationError as e:
+            logger.warning(
+                "Invalid XPath expression: endpoint=%s, xpath=%s, error=%s", endpoint, xpath, e
+            )
+            return None, format_error_response(
+                code="INVALID_XPATH",
+                message="Invalid XPath expression",
+                details=str(e),
+                status_code=400
+            )
+
+    return XmlRequestParams(**values), None
+
+
+def validated_xml_request(endpoint: str, csv_options: bool = False, xpath_options: bool = False):
+    """
+    Decorator running all pre-body checks of a conversion endpoint.
+
+    Performs the shared request checks (_validate_xml_request) and query
+    parameter validation, returning the error response directly on failure.
+    On success the validated parameters are stored in g.xml_params, so the
+    view only has to read the body and convert.
+
+    Args:
+        endpoint (str): Endpoint path used in log messages
+        csv_options (bool): Accept the delimiter parameter
+        xpath_options (bool): Require xpath and accept namespaces/path_separator
+
+    Returns:
+        Callable: Decorator for a view function
+
+    Example:
+        @convert_bp.route('/convert/xml-to-csv', methods=['POST'])
+        @validated_xml_request('/convert/xml-to-csv', csv_options=True)
+        def convert_xml_to_csv():
+            params = g.xml_params
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            error_response = _validate_xml_request(endpoint)
+            if error_response is not None:
+                return error_response
+            params, error_response = _parse_request_params(endpoint, csv_options, xpath_options)
+            if error_response is not None:
+                return error_response
+            g.xml_params = params
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+@convert_bp.app_errorhandler(RequestEntityTooLarge)
+def handle_request_entity_too_large(error):
+    """
+    Return the structured 413 response when Werkzeug enforces MAX_CONTENT_LENGTH.
+
+    Args:
+        error (RequestEntityTooLarge): Error raised while reading the request body
+
+    Returns:
+        tuple: File size error response (HTTP 413)
+    """
+    return format_file_size_error(max_size_mb=300)
+
+
+@convert_bp.errorhandler(Exception)
+def handle_unexpected_error(error):
+    """
+    Log an unexpected conversion failure once and return a sanitized 500 response.
+
+    Route handlers only catch the errors they expect (parse, size and option
+    validation) and let anything else propagate here, so the traceback is
+    formatted a single time per failed request rather than in every handler.
+
+    Args:
+        error (Exception): Unhandled exception raised by a convert_bp view
+
+    Returns:
+        tuple: Server error response (HTTP 500), or the HTTPException unchanged
+    """
+    if isinstance(error, HTTPException):
+        return error
+    logger.error(
+        "Unexpected server error: endpoint=%s, error=%s: %s",
+        request.path, type(error).__name__, error,
+        exc_info=True,
+        extra={'endpoint': request.path}
+    )
+    return format_server_error(str(error))
+
+
+@convert_bp.route('/health', methods=['GET'])
+def health_check():
+    """
+    Health check endpoint.
+
+    Returns a simple JSON status response for monitoring and orchestration
+    platforms (Kubernetes, ECS, etc.).
+
+    Returns:
+        tuple: JSON response body, HTTP status code (200 OK) and headers
+    """
+    return _HEALTH_BODY, 200, _HEALTH_HEADERS
+
+
+@convert_bp.route('/convert/xml-to-json', methods=['POST'])
+@validated_xml_request('/convert/xml-to-json')
+def convert_xml_to_json():
+    """
+    POST endpoint for converting XML to JSON.
+
+    Accepts XML data in request body, validates Content-Type header,
+    calls the conversion service, and returns JSON response.
+
+    Returns:
+        tuple: JSON response and HTTP status code (200 OK on success)
+            or error response with appropriate HTTP status code
+
+    Error Responses:
+        - 413 Payload Too Large: Request size exceeds maximum limit (300MB)
+        - 400 Bad Request: Invalid or missing Content-Type header
+        - 400 Bad Request: Malformed XML (XMLValidationError)
+        - 500 Internal Server Error: Unexpected server error
+    """
+    endpoint = '/convert/xml-to-json'
+
+    xml_bytes, file_size_bytes, error_response = _read_body(endpoint)
+    if error_response is not None:
+        return error_response
+
     # Call conversion service and handle errors
     try:
-        # Performance monitoring: record start time and file size
-        start_time = time.time()
-        file_size_bytes = len(xml_string.encode('utf-8'))
-        
-        # Track memory usage before processing (if available)
-        memory_before = None
-        try:
-            # Try to get memory usage using psutil if available, otherwise skip
-            # We don't want to make it a hard dependency, so we handle ImportError
-            import psutil
-            process = psutil.Process()
-            memory_before = process.memory_info().rss / (1024 * 1024)  # MB
-        except ImportError:
-            # psutil not available, skip memory tracking
-            pass
-        except Exception:
-            # Any other error, skip memory tracking
-            pass
-        
-        # Perform conversion
-        json_result = convert_xml_string_to_json(xml_string)
-        
-        # Calculate performance metrics
-        processing_time = time.time() - start_time
-        
-        # Track memory usage after processing (if available)
-        memory_after = None
-        memory_delta = None
-        try:
-            import psutil
-            process = psutil.Process()
-            memory_after = process.memory_info().rss / (1024 * 1024)  # MB
-            if memory_before is not None:
-                memory_delta = memory_after - memory_before
-        except ImportError:
-            pass
-        except Exception:
-            pass
-        
-        # Create response
-        response = jsonify(json_result)
-        response.headers['Content-Type'] = 'application/json'
-        
-        # Log performance metrics using structured logging
-        log_data = {
-            'endpoint': endpoint,
-            'file_size_bytes': file_size_bytes,
-            'processing_time_seconds': round(processing_time, 3),
-            'status': 'success'
-        }
-        
-        # Add memory metrics if available
-        if memory_before is not None:
-            log_data['memory_before_mb'] = round(memory_before, 2)
-        if memory_after is not None:
-            log_data['memory_after_mb'] = round(memory_after, 2)
-        if memory_delta is not None:
-            log_data['memory_delta_mb'] = round(memory_delta, 2)
-        
-        # Format log message
-        log_parts = [f"{k}={v}" for k, v in log_data.items()]
-        logger.info(f"Conversion successful: {', '.join(log_parts)}")
-        
-        return response, 200
+        # Time and (optionally) memory-profile the conversion; metrics are logged on success
+        with _perf_trace(endpoint, file_size_bytes=file_size_bytes):
+            if xml_bytes is None:
+                json_result = convert_xml_stream_to_json(request.stream, max_size=Config.MAX_FILE_SIZE)
+            else:
+                json_result = convert_xml_string_to_json(xml_bytes)
+
+        return _json_response(json_result), 200
+    except FileSizeExceededError as e:
+        # Streamed body turned out larger than the limit
+        logger.warning(
+            "Request size exceeded limit: endpoint=%s, max_size=%s, actual_size=%s",
+            endpoint, e.max_size_bytes, e.actual_size_bytes
+        )
+        return format_file_size_error(max_size_mb=300)
     except XMLValidationError as e:
         # Handle XML validation errors (malformed XML)
         logger.warning(
-            f"XML validation error: endpoint={endpoint}, "
-            f"error={str(e)}, line={e.line}, column={e.column}"
+            "XML validation error: endpoint=%s, error=%s, line=%s, column=%s",
+            endpoint, e, e.line, e.column
         )
         return format_xml_validation_error(e)
-    except Exception as e:
-        # Handle unexpected errors - log full details but return sanitized message
-        logger.error(
-            f"Unexpected server error: endpoint={endpoint}, "
-            f"error={str(e)}",
-            exc_info=True
-        )
-        return format_server_error(str(e))
 
 
 @convert_bp.route('/convert/xml-to-csv', methods=['POST'])
+@validated_xml_request('/convert/xml-to-csv', csv_options=True)
 def convert_xml_to_csv():
     """
     POST endpoint for converting XML to CSV.
@@ -234,175 +631,43 @@ def convert_xml_to_csv():
         POST /convert/xml-to-csv?delimiter=\\t
     """
     endpoint = '/convert/xml-to-csv'
-    
-    # Log request received
-    content_type = request.headers.get('Content-Type', 'missing')
-    content_length = request.headers.get('Content-Length', 'unknown')
-    logger.info(
-        f"Request received: endpoint={endpoint}, "
-        f"Content-Type={content_type}, Content-Length={content_length}"
-    )
-
-    # Validate request size BEFORE any processing (early rejection to save resources)
-    try:
-        validate_request_size(request)
-    except FileSizeExceededError as e:
-        logger.warning(
-            f"Request size exceeded limit: endpoint={endpoint}, "
-            f"max_size={e.max_size_bytes}, actual_size={e.actual_size_bytes}"
-        )
-        # Return HTTP 413 (Payload Too Large) with structured error format
-        return format_file_size_error(max_size_mb=300)
+    params = g.xml_params
 
-    # Validate Content-Type header
-    content_type_lower = content_type.lower()
-    if content_type_lower not in ['application/xml', 'text/xml']:
-        logger.warning(
-            f"Content-Type validation failed: endpoint={endpoint}, "
-            f"received={content_type}"
-        )
-        return format_content_type_error(content_type)
+    xml_bytes, file_size_bytes, error_response = _read_body(endpoint)
+    if error_response is not None:
+        return error_response
 
-    # Extract XML string from request body
+    # Call conversion service and handle errors
     try:
-        xml_string = request.get_data(as_text=True)
-        if not xml_string:
-            logger.warning(
-                f"Empty request body: endpoint={endpoint}"
-            )
-            return format_error_response(
-                code=EMPTY_REQUEST_BODY,
-                message="Request body is empty",
-                details="XML content is required in the request body",
-                status_code=400
+        # Time and (optionally) memory-profile the conversion; metrics are logged on success.
+        # Parsing and row collection happen here, the CSV text is rendered lazily while
+        # the response is sent
+        with _perf_trace(endpoint, file_size_bytes=file_size_bytes):
+            _, csv_chunks = convert_xml_to_csv_chunks(
+                request.stream if xml_bytes is None else xml_bytes,
+                delimiter=params.delimiter, max_size=Config.MAX_FILE_SIZE
             )
-    except Exception as e:
-        logger.error(
-            f"Failed to read request body: endpoint={endpoint}, "
-            f"error={str(e)}",
-            exc_info=True
-        )
-        return format_error_response(
-            code=REQUEST_READ_ERROR,
-            message="Failed to read request body",
-            details=str(e),
-            status_code=400
-        )
 
-    # Extract delimiter from query parameters (default: comma)
-    delimiter = request.args.get('delimiter', ',')
-    
-    # Validate delimiter is a single character
-    if len(delimiter) != 1:
+        # Stream the CSV chunks instead of building the whole document in memory
+        return _csv_response(csv_chunks), 200
+    except FileSizeExceededError as e:
+        # Streamed body turned out larger than the limit
         logger.warning(
-            f"Invalid delimiter: endpoint={endpoint}, delimiter={delimiter}"
-        )
-        return format_error_response(
-            code="INVALID_DELIMITER",
-            message="Delimiter must be a single character",
-            details=f"Received delimiter: {delimiter}. Common options: ',' (comma), ';' (semicolon), '\\t' (tab), '|' (pipe)",
-            status_code=400
+            "Request size exceeded limit: endpoint=%s, max_size=%s, actual_size=%s",
+            endpoint, e.max_size_bytes, e.actual_size_bytes
         )
-    
-    # Call conversion service and handle errors
-    try:
-        # Performance monitoring: record start time and file size
-        start_time = time.time()
-        file_size_bytes = len(xml_string.encode('utf-8'))
-        
-        # Track memory usage before processing (if available)
-        memory_before = None
-        try:
-            # Try to get memory usage using psutil if available, otherwise skip
-            # We don't want to make it a hard dependency, so we handle ImportError
-            import psutil
-            process = psutil.Process()
-            memory_before = process.memory_info().rss / (1024 * 1024)  # MB
-        except ImportError:
-            # psutil not available, skip memory tracking
-            pass
-        except Exception:
-            # Any other error, skip memory tracking
-            pass
-        
-        # Perform conversion with specified delimiter
-        csv_result = convert_xml_string_to_csv(xml_string, delimiter=delimiter)
-        
-        # Calculate performance metrics
-        processing_time = time.time() - start_time
-        
-        # Track memory usage after processing (if available)
-        memory_after = None
-        memory_delta = None
-        try:
-            import psutil
-            process = psutil.Process()
-            memory_after = process.memory_info().rss / (1024 * 1024)  # MB
-            if memory_before is not None:
-                memory_delta = memory_after - memory_before
-        except ImportError:
-            pass
-        except Exception:
-            pass
-        
-        # Create response with CSV content and proper Content-Type header
-        response = Response(csv_result, mimetype='text/csv')
-        response.headers['Content-Type'] = 'text/csv'
-        
-        # Log performance metrics using structured logging
-        log_data = {
-            'endpoint': endpoint,
-            'file_size_bytes': file_size_bytes,
-            'processing_time_seconds': round(processing_time, 3),
-            'status': 'success'
-        }
-        
-        # Add memory metrics if available
-        if memory_before is not None:
-            log_data['memory_before_mb'] = round(memory_before, 2)
-        if memory_after is not None:
-            log_data['memory_after_mb'] = round(memory_after, 2)
-        if memory_delta is not None:
-            log_data['memory_delta_mb'] = round(memory_delta, 2)
-        
-        # Format log message
-        log_parts = [f"{k}={v}" for k, v in log_data.items()]
-        logger.info(f"Conversion successful: {', '.join(log_parts)}")
-        
-        return response, 200
+        return format_file_size_error(max_size_mb=300)
     except XMLValidationError as e:
         # Handle XML validation errors (malformed XML)
         logger.warning(
-            f"XML validation error: endpoint={endpoint}, "
-            f"error={str(e)}, line={e.line}, column={e.column}"
+            "XML validation error: endpoint=%s, error=%s, line=%s, column=%s",
+            endpoint, e, e.line, e.column
         )
         return format_xml_validation_error(e)
-    except ValueError as e:
-        # Handle delimiter validation errors (CSV endpoint only)
-        if "Delimiter" in str(e):
-            logger.warning(
-                f"Delimiter validation error: endpoint={endpoint}, "
-                f"error={str(e)}"
-            )
-            return format_error_response(
-                code="INVALID_DELIMITER",
-                message="Invalid delimiter specified",
-                details=str(e),
-                status_code=400
-            )
-        # Re-raise if it's a different ValueError
-        raise
-    except Exception as e:
-        # Handle unexpected errors - log full details but return sanitized message
-        logger.error(
-            f"Unexpected server error: endpoint={endpoint}, "
-            f"error={str(e)}",
-            exc_info=True
-        )
-        return format_server_error(str(e))
 
 
 @convert_bp.route('/convert/xml-to-csv-xpath', methods=['POST'])
+@validated_xml_request('/convert/xml-to-csv-xpath', csv_options=True, xpath_options=True)
 def convert_xml_to_csv_xpath():
     """
     POST endpoint for converting XML to CSV using XPath to select specific elements.
@@ -443,246 +708,54 @@ def convert_xml_to_csv_xpath():
         POST /convert/xml-to-csv-xpath?xpath=//item&delimiter=;
     """
     endpoint = '/convert/xml-to-csv-xpath'
+    params = g.xml_params
+    xpath = params.xpath
     
-    # Log request received
-    content_type = request.headers.get('Content-Type', 'missing')
-    content_length = request.headers.get('Content-Length', 'unknown')
-    logger.info(
-        f"Request received: endpoint={endpoint}, "
-        f"Content-Type={content_type}, Content-Length={content_length}"
-    )
-    
-    # Extract XPath from query parameters (required)
-    # Try lowercase first, then case-insensitive search
-    xpath = request.args.get('xpath', '').strip()
-    if not xpath:
-        # Try case-insensitive search for common variations
-        for key in request.args.keys():
-            if key.lower() == 'xpath':
-                xpath = request.args.get(key, '').strip()
-                break
-    
-    if not xpath:
-        logger.warning(
-            f"Missing XPath parameter: endpoint={endpoint}"
-        )
-        return format_error_response(
-            code="MISSING_XPATH",
-            message="XPath parameter is required",
-            details="Please provide an XPath expression via ?xpath= query parameter (e.g., ?xpath=//item). Send XML content in the request body.",
-            status_code=400
-        )
-    
-    # Extract delimiter from query parameters (optional, default: comma)
-    delimiter = request.args.get('delimiter', ',')
-    
-    # Validate delimiter is a single character
-    if len(delimiter) != 1:
-        logger.warning(
-            f"Invalid delimiter: endpoint={endpoint}, delimiter={delimiter}"
-        )
-        return format_error_response(
-            code="INVALID_DELIMITER",
-            message="Delimiter must be a single character",
-            details=f"Received delimiter: {delimiter}. Common options: ',' (comma), ';' (semicolon), '\\t' (tab), '|' (pipe)",
-            status_code=400
-        )
-    
-    # Extract namespaces from query parameters (optional, JSON-encoded)
-    namespaces = None
-    namespaces_str = request.args.get('namespaces', '').strip()
-    if namespaces_str:
-        try:
-            namespaces = json.loads(namespaces_str)
-            if not isinstance(namespaces, dict):
-                return format_error_response(
-                    code="INVALID_NAMESPACES",
-                    message="Namespaces must be a valid JSON object",
-                    details="Expected format: {\"prefix\": \"uri\"} (e.g., {\"wd\": \"urn:com.workday/bsvc\"})",
-                    status_code=400
-                )
-        except json.JSONDecodeError as e:
-            return format_error_response(
-                code="INVALID_NAMESPACES",
-                message="Invalid JSON in namespaces parameter",
-                details=str(e),
-                status_code=400
-            )
-    
-    # Extract path separator from query parameters (optional, default: slash)
-    path_separator = request.args.get('path_separator', '/')
-    # Validate path separator is 1-2 characters (allow for // double slash)
-    if len(path_separator) == 0 or len(path_separator) > 2:
-        logger.warning(
-            f"Invalid path separator: endpoint={endpoint}, path_separator={path_separator}"
-        )
-        return format_error_response(
-            code="INVALID_PATH_SEPARATOR",
-            message="Path separator must be 1-2 characters",
-            details=f"Received path_separator: {path_separator}. Common options: '/' (slash - default), '//' (double slash), '_' (underscore), '-' (dash), '.' (dot)",
-            status_code=400
-        )
-    
-    # Extract XML string from request body (raw XML content)
+    xml_bytes, file_size_bytes, error_response = _read_body(endpoint, whitespace_is_empty=True)
+    if error_response is not None:
+        return error_response
+
+    # Call conversion service and handle errors
     try:
-        xml_string = request.get_data(as_text=True)
-        if not xml_string or not xml_string.strip():
-            logger.warning(
-                f"Empty request body: endpoint={endpoint}"
-            )
-            return format_error_response(
-                code=EMPTY_REQUEST_BODY,
-                message="Request body is empty",
-                details="XML content is required in the request body",
-                status_code=400
+        # Time and (optionally) memory-profile the conversion; metrics are logged on success.
+        # Parsing, XPath evaluation and row collection happen here, the CSV text is
+        # rendered lazily while the response is sent
+        with _perf_trace(endpoint, xpath=xpath, file_size_bytes=file_size_bytes) as metrics:
+            # The expression is passed as a string so name-only XPaths can take the
+            # incremental-parse path; other expressions hit the compiled-XPath cache
+            row_count, csv_chunks = convert_xml_to_csv_chunks_by_xpath(
+                request.stream if xml_bytes is None else xml_bytes, xpath,
+                delimiter=params.delimiter, namespaces=params.namespaces, path_separator=params.path_separator,
+                max_size=Config.MAX_FILE_SIZE
             )
-    except Exception as e:
-        logger.error(
-            f"Failed to read request body: endpoint={endpoint}, "
-            f"error={str(e)}",
-            exc_info=True
-        )
-        return format_error_response(
-            code=REQUEST_READ_ERROR,
-            message="Failed to read request body",
-            details=str(e),
-            status_code=400
-        )
-    
-    # Validate request size BEFORE any processing
-    try:
-        validate_request_size(request)
+            # Row count comes from the converter, so the output never has to be scanned
+            if row_count:
+                metrics['rows_extracted'] = row_count
+
+        # Stream the CSV chunks instead of building the whole document in memory
+        return _csv_response(csv_chunks), 200
     except FileSizeExceededError as e:
+        # Streamed body turned out larger than the limit
         logger.warning(
-            f"Request size exceeded limit: endpoint={endpoint}, "
-            f"max_size={e.max_size_bytes}, actual_size={e.actual_size_bytes}"
+            "Request size exceeded limit: endpoint=%s, max_size=%s, actual_size=%s",
+            endpoint, e.max_size_bytes, e.actual_size_bytes
         )
         return format_file_size_error(max_size_mb=300)
-    
-    # Validate Content-Type header (should be XML)
-    content_type_lower = content_type.lower()
-    if content_type_lower not in ['application/xml', 'text/xml']:
+    except XPathEvaluationError as e:
+        # The expression compiled up front but failed against this document
         logger.warning(
-            f"Content-Type validation failed: endpoint={endpoint}, "
-            f"received={content_type}"
+            "XPath evaluation error: endpoint=%s, error=%s, xpath=%s", endpoint, e, xpath
+        )
+        return format_error_response(
+            code="XPATH_ERROR",
+            message="XPath evaluation failed",
+            details=str(e),
+            status_code=400
         )
-        return format_content_type_error(content_type)
-    
-    # Call conversion service and handle errors
-    try:
-        # Performance monitoring: record start time and file size
-        start_time = time.time()
-        file_size_bytes = len(xml_string.encode('utf-8'))
-        
-        # Track memory usage before processing (if available)
-        memory_before = None
-        try:
-            import psutil
-            process = psutil.Process()
-            memory_before = process.memory_info().rss / (1024 * 1024)  # MB
-        except ImportError:
-            pass
-        except Exception:
-            pass
-        
-        # Perform conversion with XPath
-        csv_result = convert_xml_string_to_csv_by_xpath(xml_string, xpath, delimiter=delimiter, namespaces=namespaces, path_separator=path_separator)
-        
-        # Calculate performance metrics
-        processing_time = time.time() - start_time
-        
-        # Track memory usage after processing (if available)
-        memory_after = None
-        memory_delta = None
-        try:
-            import psutil
-            process = psutil.Process()
-            memory_after = process.memory_info().rss / (1024 * 1024)  # MB
-            if memory_before is not None:
-                memory_delta = memory_after - memory_before
-        except ImportError:
-            pass
-        except Exception:
-            pass
-        
-        # Create response with CSV content and proper Content-Type header
-        response = Response(csv_result, mimetype='text/csv')
-        response.headers['Content-Type'] = 'text/csv'
-        
-        # Log performance metrics using structured logging
-        log_data = {
-            'endpoint': endpoint,
-            'xpath': xpath,
-            'file_size_bytes': file_size_bytes,
-            'processing_time_seconds': round(processing_time, 3),
-            'status': 'success'
-        }
-        
-        # Add memory metrics if available
-        if memory_before is not None:
-            log_data['memory_before_mb'] = round(memory_before, 2)
-        if memory_after is not None:
-            log_data['memory_after_mb'] = round(memory_after, 2)
-        if memory_delta is not None:
-            log_data['memory_delta_mb'] = round(memory_delta, 2)
-        
-        # Count rows in output
-        if csv_result:
-            row_count = len([line for line in csv_result.split('\n') if line.strip()]) - 1  # -1 for header
-            log_data['rows_extracted'] = row_count
-        
-        # Format log message
-        log_parts = [f"{k}={v}" for k, v in log_data.items()]
-        logger.info(f"Conversion successful: {', '.join(log_parts)}")
-        
-        return response, 200
     except XMLValidationError as e:
-        # Handle XML validation errors (malformed XML or invalid XPath)
+        # Handle XML validation errors (malformed XML)
         logger.warning(
-            f"XML validation/XPath error: endpoint={endpoint}, "
-            f"error={str(e)}, xpath={xpath}, line={getattr(e, 'line', None)}, column={getattr(e, 'column', None)}"
+            "XML validation error: endpoint=%s, error=%s, xpath=%s, line=%s, column=%s",
+            endpoint, e, xpath, e.line, e.column
         )
-        # Check if it's an XPath error or XML parsing error
-        if "XPath" in str(e) or "xpath" in str(e).lower():
-            return format_error_response(
-                code="XPATH_ERROR",
-                message="XPath evaluation failed",
-                details=str(e),
-                status_code=400
-            )
         return format_xml_validation_error(e)
-    except ValueError as e:
-        # Handle delimiter validation errors
-        if "Delimiter" in str(e):
-            logger.warning(
-                f"Delimiter validation error: endpoint={endpoint}, "
-                f"error={str(e)}"
-            )
-            return format_error_response(
-                code="INVALID_DELIMITER",
-                message="Invalid delimiter specified",
-                details=str(e),
-                status_code=400
-            )
-        elif "XPath" in str(e):
-            logger.warning(
-                f"XPath validation error: endpoint={endpoint}, "
-                f"error={str(e)}"
-            )
-            return format_error_response(
-                code="INVALID_XPATH",
-                message="Invalid XPath expression",
-                details=str(e),
-                status_code=400
-            )
-        # Re-raise if it's a different ValueError
-        raise
-    except Exception as e:
-        # Handle unexpected errors - log full details but return sanitized message
-        logger.error(
-            f"Unexpected server error: endpoint={endpoint}, "
-            f"error={str(e)}, xpath={xpath}",
-            exc_info=True
-        )
-        return format_server_error(str(e))
-
@@ -8,70 +8,185 @@ and ensuring RFC 4180 compliance.
 
 import csv
 import io
-from typing import List, Dict, Any, Optional, Set
+import re
+import sys
+from functools import lru_cache
+from itertools import chain, repeat
+from typing import List, Dict, Any, Optional, Set, BinaryIO, Tuple, Union, Iterable, Iterator
 from lxml import etree
 
-from app.services.xml_parser import parse_xml
-from app.exceptions import XMLValidationError
+from app.services.xml_parser import parse_xml, parse_xml_stream, iterparse_xml
+from app.exceptions import XMLValidationError, XPathEvaluationError, FileSizeExceededError
 
+# Maximum number of compiled XPath expressions kept in memory. XPaths come from
+# client query strings, so the cache is bounded rather than growing per distinct query.
+XPATH_CACHE_SIZE = 512
 
-def _extract_local_name_and_prefix(element: etree._Element) -> tuple[str, Optional[str]]:
+# Maximum number of distinct tag strings whose split form is cached
+TAG_CACHE_SIZE = 4096
+
+# Maximum number of distinct column names kept by the column-name builders
+COLUMN_NAME_CACHE_SIZE = 8192
+
+# Approximate number of characters of CSV text buffered before a chunk is emitted
+CSV_CHUNK_SIZE = 64 * 1024
+
+# Rows handed to csv.writer.writerows() per call
+CSV_WRITE_BATCH_ROWS = 1024
+
+# XPath expressions that select elements purely by name anywhere in the document
+# ("//item", "//wd:Job_Requisition"); these can be answered with a filtered
+# incremental parse instead of a full tree plus XPath evaluation
+_SIMPLE_XPATH_RE = re.compile(r'^//(?:([A-Za-z_][\w.\-]*):)?([A-Za-z_][\w.\-]*)$')
+
+
+@lru_cache(maxsize=XPATH_CACHE_SIZE)
+def _compile_xpath(xpath: str, namespace_items: Tuple[Tuple[str, str], ...]) -> etree.XPath:
     """
-    Extract local name and prefix from XML element.
-    
+    Compile an XPath expression once per distinct (expression, namespaces) pair.
+
+    Clients typically repeat the same XPath across many documents, so the
+    compiled evaluator is reused instead of re-parsing the expression on every
+    request. lxml serializes evaluation of a shared XPath object internally,
+    so cached evaluators are safe to use from multiple threads.
+
     Args:
-        element: XML element from lxml
-        
+        xpath (str): XPath expression
+        namespace_items (Tuple[Tuple[str, str], ...]): Sorted (prefix, uri) pairs
+
     Returns:
-        Tuple of (local_name, prefix)
+        etree.XPath: Compiled XPath evaluator
+
+    Raises:
+        etree.XPathSyntaxError: If the expression is not valid XPath
+    """
+    return etree.XPath(xpath, namespaces=dict(namespace_items))
+
+
+def compile_xpath(xpath: str, namespaces: Optional[Dict[str, str]] = None) -> etree.XPath:
+    """
+    Return the cached compiled evaluator for an XPath expression.
+
+    Lets callers that already know the namespace mapping compile (and
+    validate) the expression up front and pass the evaluator to the XPath
+    conversion functions, so the per-document work is evaluation only.
+
+    Args:
+        xpath (str): XPath expression
+        namespaces (Dict[str, str], optional): Namespace mapping (prefix -> URI)
+
+    Returns:
+        etree.XPath: Compiled XPath evaluator, shared between callers
+
+    Raises:
+        XPathEvaluationError: If the expression is not valid XPath
+
+    Example:
+        evaluator = compile_xpath("//wd:Job_Requisition", {"wd": "urn:com.workday/bsvc"})
+        row_count, chunks = convert_xml_to_csv_chunks_by_xpath(xml_bytes, evaluator)
+    """
+    namespace_items = tuple(sorted(namespaces.items())) if namespaces else ()
+    try:
+        return _compile_xpath(xpath, namespace_items)
+    except etree.XPathSyntaxError as e:
+        raise XPathEvaluationError(f"Invalid XPath expression: {str(e)}")
+
+
+@lru_cache(maxsize=TAG_CACHE_SIZE)
+def _split_tag(tag: str) -> Tuple[str, Optional[str], bool]:
+    """
+    Split a tag string into its local name and textual prefix, once per distinct tag.
+
+    Documents repeat a small set of tag names across many elements, so the
+    string parsing is cached by tag rather than redone for every element.
+
+    Args:
+        tag (str): Element tag ("{uri}local", "prefix:local" or "local")
+
+    Returns:
+        Tuple[str, Optional[str], bool]: (local_name, prefix written in the tag,
+            whether the tag is in Clark "{uri}local" notation)
     """
-    tag = element.tag
-    
-    # Try to get prefix from element (lxml provides this for prefixed namespaces)
-    prefix = element.prefix if hasattr(element, 'prefix') else None
-    
     # Handle lxml's namespace format: "{namespace}localname"
     if tag.startswith("{") and "}" in tag:
-        local_name = tag.split("}", 1)[1]
-        return local_name, prefix
-    
+        return tag.split("}", 1)[1], None, True
+
     # Handle prefixed namespace: "prefix:localname" (shouldn't happen with lxml, but handle it)
     if ":" in tag:
         prefix, local_name = tag.split(":", 1)
-        return local_name, prefix
-    
+        return local_name, prefix, False
+
     # No namespace
-    return tag, None
+    return tag, None, False
 
 
-def _get_namespace_prefix_for_column(element: etree._Element, namespace_uri: Optional[str]) -> Optional[str]:
+@lru_cache(maxsize=TAG_CACHE_SIZE)
+def _split_attr(attr_name: str) -> Tuple[str, Optional[str]]:
     """
-    Get prefix for a namespace URI for use in column names.
+    Split an attribute name into its local name and namespace URI, once per distinct name.
+
+    Sibling rows usually repeat the same attributes, so the split is cached by
+    attribute name rather than redone for every attribute of every element.
+
+    Args:
+        attr_name (str): Attribute name ("{uri}local" or "local")
+
+    Returns:
+        Tuple[str, Optional[str]]: (local_name, namespace URI or None)
+    """
+    if attr_name.startswith("{") and "}" in attr_name:
+        namespace_uri, local_name = attr_name[1:].split("}", 1)
+        return local_name, namespace_uri
+    return attr_name, None
+
+
+def _extract_local_name_and_prefix(element: etree._Element) -> tuple[str, Optional[str]]:
+    """
+    Extract local name and prefix from XML element.
     
     Args:
-        element: XML element
-        namespace_uri: Namespace URI to find prefix for
+        element: XML element from lxml
         
     Returns:
-        Prefix string or None if not found or default namespace
+        Tuple of (local_name, prefix)
     """
-    if not namespace_uri:
-        return None
+    local_name, prefix, namespaced = _split_tag(element.tag)
+    if namespaced:
+        # The prefix in use is only known to the element (lxml provides it for prefixed namespaces)
+        return local_name, element.prefix
+    return local_name, prefix
+
+
+def _namespace_prefixes(element: etree._Element) -> Dict[str, Optional[str]]:
+    """
+    Map namespace URIs declared on the document root to prefixes for use in column names.
+    
+    Built once per conversion and passed down, instead of walking to the root
+    and scanning its nsmap for every namespaced attribute.
     
-    nsmap = element.getroottree().getroot().nsmap if hasattr(element, 'getroottree') else getattr(element, 'nsmap', {})
-    if nsmap:
-        # Look for namespace URI in the map (reverse lookup)
-        for prefix, uri in nsmap.items():
-            if uri == namespace_uri:
-                return prefix if prefix is not None else None
-    return None
+    Args:
+        element: Any element of the document
+        
+    Returns:
+        Dictionary of namespace URI to prefix (None for the default namespace);
+        look up unknown URIs with .get() to get None
+    """
+    uri_to_prefix = {}
+    for prefix, uri in element.getroottree().getroot().nsmap.items():
+        # First declaration wins, as in a forward scan of the nsmap
+        uri_to_prefix.setdefault(uri, prefix)
+    return uri_to_prefix
 
 
+@lru_cache(maxsize=COLUMN_NAME_CACHE_SIZE)
 def _build_column_name(name: str, prefix: Optional[str], parent_path: str = "", path_separator: str = "/") -> str:
     """
     Build CSV column name from element/attribute name and namespace prefix.
     
     For nested structures, prepend parent path. For namespaces, include prefix.
+    Cached: rows of the same shape rebuild the same names, so each distinct
+    column name is formatted once and the same string object is reused. Names
+    are interned, so they stay shared even after falling out of the cache.
     
     Args:
         name: Local name of element or attribute
@@ -90,10 +205,28 @@ def _build_column_name(name: str, prefix: Optional[str], parent_path: str = "",
     if parent_path:
         col_name = f"{parent_path}{path_separator}{col_name}"
     
-    return col_name
+    return sys.intern(col_name)
+
+
+@lru_cache(maxsize=COLUMN_NAME_CACHE_SIZE)
+def _attribute_column_name(name: str, prefix: Optional[str], parent_path: str, path_separator: str) -> str:
+    """
+    Build the CSV column name of an attribute, e.g. "item/@id" or "item/@wd:ID".
+
+    Args:
+        name: Local name of the attribute
+        prefix: Namespace prefix (None for no namespace)
+        parent_path: Column path of the owning element ("" at the top level)
+        path_separator: Character(s) joining the parent path and the attribute
+
+    Returns:
+        Column name string (cached per distinct arguments, interned)
+    """
+    attr_base_name = f"{prefix}:{name}" if prefix else name
+    return sys.intern(f"{parent_path}{path_separator}@{attr_base_name}" if parent_path else f"@{attr_base_name}")
 
 
-def _collect_row_data_starting_from_children(element: etree._Element, parent_path: str = "", path_separator: str = "/") -> Dict[str, Any]:
+def _collect_row_data_starting_from_children(element: etree._Element, parent_path: str = "", path_separator: str = "/", uri_to_prefix: Optional[Dict[str, Optional[str]]] = None) -> Dict[str, Any]:
     """
     Collect data from element's attributes and children into a dictionary row.
     
@@ -106,46 +239,39 @@ def _collect_row_data_starting_from_children(element: etree._Element, parent_pat
         element: XML element whose attributes and children to collect data from
         parent_path: Parent path for column headers (should be the matched element's name)
         path_separator: Character(s) to use when joining parent path to child name (default: "/")
+        uri_to_prefix: Namespace URI to prefix map from _namespace_prefixes() (built from the element when None)
         
     Returns:
         Dictionary with column names as keys and values
     """
+    if uri_to_prefix is None:
+        uri_to_prefix = _namespace_prefixes(element)
     row = {}
     
     # Add attributes of the matched element (using @attribute_name format)
     local_name, prefix = _extract_local_name_and_prefix(element)
-    for attr_name, attr_value in element.attrib.items():
-        attr_local = attr_name
-        attr_prefix = None
-        
-        if attr_name.startswith("{") and "}" in attr_name:
-            namespace_uri, attr_local = attr_name[1:].split("}", 1)
-            attr_prefix = _get_namespace_prefix_for_column(element, namespace_uri)
+    for attr_name, attr_value in element.items():
+        attr_local, namespace_uri = _split_attr(attr_name)
+        attr_prefix = uri_to_prefix.get(namespace_uri) if namespace_uri else None
         
         # Build column name with @ prefix to indicate it's an attribute
         # Format: parent/@attribute_name (e.g., "item/@id" or "wd:Job_Requisition/@wd:ID")
-        attr_base_name = _build_column_name(attr_local, attr_prefix, "", path_separator)
-        col_name = f"{parent_path}{path_separator}@{attr_base_name}" if parent_path else f"@{attr_base_name}"
+        col_name = _attribute_column_name(attr_local, attr_prefix, parent_path, path_separator)
         row[col_name] = attr_value
     
-    # Process children of the matched element
-    children = list(element)
-    
-    for child in children:
+    # Process children of the matched element (lxml iterates children natively)
+    for child in element:
         child_local, child_prefix = _extract_local_name_and_prefix(child)
         # Build path for nested columns starting from parent
-        child_base_name = _build_column_name(child_local, child_prefix, "", path_separator)
-        new_path = f"{parent_path}{path_separator}{child_base_name}" if parent_path else child_base_name
+        new_path = _build_column_name(child_local, child_prefix, parent_path, path_separator)
         
-        # Recurse into child to collect its data
-        child_data = _collect_row_data(child, new_path, path_separator)
-        # Update row with child data (which already has proper column names with paths)
-        row.update(child_data)
+        # Collect the child's data straight into the row (column names carry the full path)
+        _add_row_data(row, child, new_path, path_separator, uri_to_prefix)
     
     return row
 
 
-def _collect_row_data(element: etree._Element, path: str = "", path_separator: str = "/") -> Dict[str, Any]:
+def _collect_row_data(element: etree._Element, path: str = "", path_separator: str = "/", uri_to_prefix: Optional[Dict[str, Optional[str]]] = None) -> Dict[str, Any]:
     """
     Collect data from a single element into a dictionary row.
     
@@ -153,184 +279,489 @@ def _collect_row_data(element: etree._Element, path: str = "", path_separator: s
         element: XML element to collect data from
         path: Parent path for nested structures
         path_separator: Character(s) to use when joining parent path to child name (default: "/", can be 1-2 chars like "//")
+        uri_to_prefix: Namespace URI to prefix map from _namespace_prefixes() (built from the element when None)
         
     Returns:
         Dictionary with column names as keys and values
     """
+    if uri_to_prefix is None:
+        uri_to_prefix = _namespace_prefixes(element)
     row = {}
-    local_name, prefix = _extract_local_name_and_prefix(element)
+    _add_row_data(row, element, path, path_separator, uri_to_prefix)
+    return row
+
+
+def _add_row_data(row: Dict[str, Any], element: etree._Element, path: str, path_separator: str, uri_to_prefix: Dict[str, Optional[str]]) -> None:
+    """
+    Write a single element's data into an existing dictionary row.
     
-    # Add attributes (using @attribute_name format)
-    for attr_name, attr_value in element.attrib.items():
-        attr_local = attr_name
-        attr_prefix = None
-        
-        if attr_name.startswith("{") and "}" in attr_name:
-            namespace_uri, attr_local = attr_name[1:].split("}", 1)
-            attr_prefix = _get_namespace_prefix_for_column(element, namespace_uri)
+    Descendants write straight into the same dictionary, in the order their
+    per-element dictionaries used to be merged with update(), so the result is
+    identical without building and merging a dictionary per element.
+    
+    Args:
+        row: Dictionary row to fill in place
+        element: XML element to collect data from
+        path: Parent path for nested structures
+        path_separator: Character(s) to use when joining parent path to child name
+        uri_to_prefix: Namespace URI to prefix map from _namespace_prefixes()
+    """
+    # Add attributes (using @attribute_name format); items() skips the attrib proxy
+    for attr_name, attr_value in element.items():
+        attr_local, namespace_uri = _split_attr(attr_name)
+        attr_prefix = uri_to_prefix.get(namespace_uri) if namespace_uri else None
         
         # Build column name with @ prefix to indicate it's an attribute
         # Format: path/@attribute_name (e.g., "item/@id" or "item/@wd:ID")
-        attr_base_name = _build_column_name(attr_local, attr_prefix, "", path_separator)
-        col_name = f"{path}{path_separator}@{attr_base_name}" if path else f"@{attr_base_name}"
-        row[col_name] = attr_value
-    
-    # Add text content if element has no children
-    children = list(element)
-    text_content = (element.text or "").strip() if element.text else None
+        row[_attribute_column_name(attr_local, attr_prefix, path, path_separator)] = attr_value
     
-    if not children and text_content:
-        col_name = _build_column_name(local_name, prefix, path, path_separator)
-        row[col_name] = text_content
+    # Add text content if element has no children (len() is O(1) in lxml)
+    if not len(element):
+        text_content = element.text
+        if text_content:
+            text_content = text_content.strip()
+            if text_content:
+                local_name, prefix = _extract_local_name_and_prefix(element)
+                row[_build_column_name(local_name, prefix, path, path_separator)] = text_content
+        return
     
     # Process child elements (recurse for nested structures)
-    for child in children:
+    for child in element:
         child_local, child_prefix = _extract_local_name_and_prefix(child)
         # Build path for nested columns
-        child_base_name = _build_column_name(child_local, child_prefix, "", path_separator)
-        new_path = f"{path}{path_separator}{child_base_name}" if path else child_base_name
-        
-        # Recurse into child to collect its data
-        child_data = _collect_row_data(child, new_path, path_separator)
-        # Update row with child data (which already has proper column names with paths)
-        row.update(child_data)
+        new_path = _build_column_name(child_local, child_prefix, path, path_separator)
+        _add_row_data(row, child, new_path, path_separator, uri_to_prefix)
+
+
+def _element_attribute_columns(element: etree._Element, parent_path: str, path_separator: str, uri_to_prefix: Dict[str, Optional[str]]) -> Dict[str, Any]:
+    """
+    Collect an element's attributes as ``@name`` columns.
     
-    return row
+    Args:
+        element: XML element whose attributes to collect
+        parent_path: Parent path for the attribute column names
+        path_separator: Character(s) to use when joining parent path to attribute name
+        uri_to_prefix: Namespace URI to prefix map from _namespace_prefixes()
+        
+    Returns:
+        Dictionary mapping attribute column names to values (empty if no attributes)
+    """
+    columns = {}
+    for attr_name, attr_value in element.items():
+        attr_local, namespace_uri = _split_attr(attr_name)
+        attr_prefix = uri_to_prefix.get(namespace_uri) if namespace_uri else None
+        col_name = _attribute_column_name(attr_local, attr_prefix, parent_path, path_separator)
+        columns[col_name] = attr_value
+    return columns
 
 
-def _flatten_element(element: etree._Element, parent_path: str = "", collected_data: List[Dict[str, Any]] = None, is_root: bool = False) -> List[Dict[str, Any]]:
+def _flatten_element(element: etree._Element, parent_path: str = "", collected_data: List[Dict[str, Any]] = None, is_root: bool = False, uri_to_prefix: Optional[Dict[str, Optional[str]]] = None) -> List[Dict[str, Any]]:
     """
-    Recursively flatten XML element into list of dictionaries (rows).
+    Flatten XML element into list of dictionaries (rows).
     
     Strategy:
-    - Recursively traverse the tree
+    - Traverse the tree depth-first
     - When encountering an element with multiple children of the same name: each child becomes a row (flat structure)
-    - Otherwise: continue recursively to find flat structures deeper
+    - Otherwise: continue into children to find flat structures deeper
     - Attributes become columns
     - Child elements (with text) become columns
     - Nested structures: column names use underscore separation
     
+    The traversal is driven by ``etree.iterwalk`` with an explicit stack of
+    frames instead of Python recursion, so deep documents neither hit the
+    recursion limit nor pay per-call overhead. Each element's rows are
+    assembled at its ``end`` event from the rows its children produced.
+    
     Args:
         element: XML element to flatten
         parent_path: Path from root (for nested flattening)
         collected_data: List of row dictionaries (accumulated results)
         is_root: Whether this is the root element
+        uri_to_prefix: Namespace URI to prefix map from _namespace_prefixes() (built from the element when None)
         
     Returns:
         List of dictionaries, each representing a CSV row
     """
     if collected_data is None:
         collected_data = []
+    if uri_to_prefix is None:
+        # Resolved once for the whole document, then shared by every row
+        uri_to_prefix = _namespace_prefixes(element)
     
-    children = list(element)
-    
-    # If no children, this is a leaf - handled by _collect_row_data
-    if not children:
-        # Leaf element - collect its data if it has content
-        row = _collect_row_data(element, parent_path if not is_root else "", "_")
-        if row:
-            collected_data.append(row)
-        return collected_data
-    
-    # Check if this element has multiple children with same name (flat structure)
-    # Group children by element name (local name, ignoring namespace)
-    children_by_name: Dict[str, List[etree._Element]] = {}
-    for child in children:
-        child_local, _ = _extract_local_name_and_prefix(child)
-        if child_local not in children_by_name:
-            children_by_name[child_local] = []
-        children_by_name[child_local].append(child)
-    
-    # If we have multiple children with same name, treat as flat structure (rows)
-    has_multiple_same = any(len(group) > 1 for group in children_by_name.values())
-    
-    if has_multiple_same:
-        # Flat structure: each child element with same name becomes a row
-        # First, collect parent's attributes if it has any
-        parent_attrs = {}
-        if element.attrib:
-            local_name, prefix = _extract_local_name_and_prefix(element)
-            for attr_name, attr_value in element.attrib.items():
-                attr_local = attr_name
-                attr_prefix = None
-                if attr_name.startswith("{") and "}" in attr_name:
-                    namespace_uri, attr_local = attr_name[1:].split("}", 1)
-                    attr_prefix = _get_namespace_prefix_for_column(element, namespace_uri)
-                attr_base_name = _build_column_name(attr_local, attr_prefix, "", "_")
-                col_name = f"{parent_path}_@{attr_base_name}" if parent_path else f"@{attr_base_name}"
-                parent_attrs[col_name] = attr_value
-        
-        for child_group_name, child_group in children_by_name.items():
-            if len(child_group) > 1:
-                # Multiple children with same name - each becomes a row
-                # Use _collect_row_data to get all nested data flattened into columns
-                # Don't recursively flatten - we want one row per child, with all nested data as columns
-                for child in child_group:
-                    child_row = _collect_row_data(child, parent_path, "_")
-                    # Merge parent attributes with child data
-                    if parent_attrs:
-                        child_row = {**parent_attrs, **child_row}
-                    if child_row:  # Only add non-empty rows
-                        collected_data.append(child_row)
+    # Frame per open element: [element, local name, parent attribute columns,
+    # names of repeated child groups, child rows grouped by child local name,
+    # child rows in document order]. A flat-structure element (repeated child
+    # names) fills the groups; any other element fills the plain row list.
+    # A frame whose row list is None is a repeated child owned by its parent:
+    # it becomes a single row, so its subtree is skipped.
+    stack: List[list] = []
+    # Leaf handled entirely at its start event (its end event is then skipped)
+    leaf = None
+    walker = etree.iterwalk(element, events=('start', 'end'))
+    for event, node in walker:
+        if event == 'start':
+            local_name = None
+            if stack:
+                local_name, _ = _extract_local_name_and_prefix(node)
+                repeated = stack[-1][3]
+                if repeated and local_name in repeated:
+                    walker.skip_subtree()
+                    stack.append([node, local_name, None, None, None, None])
+                    continue
+            
+            if not len(node):
+                # Leaf: a row of its attributes and text. Whitespace-only leaves
+                # without attributes (pretty-printing) short-circuit to no row.
+                leaf = node
+                text = node.text
+                if node.attrib or (text and text.strip()):
+                    row = _collect_row_data(node, "" if is_root and not stack else parent_path, "_", uri_to_prefix)
+                    if not stack:
+                        collected_data.append(row)
+                    elif stack[-1][4] is not None:
+                        stack[-1][4][local_name].append(row)
+                    else:
+                        stack[-1][5].append(row)
+                continue
+            
+            # Cheap first pass: stop at the first repeated child name
+            # (local name, ignoring namespace)
+            seen = set()
+            for child in node:
+                child_local, _ = _extract_local_name_and_prefix(child)
+                if child_local in seen:
+                    break
+                seen.add(child_local)
             else:
-                # Single child in this group - but we have other groups with multiple
-                # Still need to process this single child, but it becomes part of nested structure
-                # Don't create a separate row for it since we're already in flat structure mode
-                child = child_group[0]
-                # Recursively check if this child has its own flat structure (deeper level)
-                child_rows = _flatten_element(child, parent_path, [], is_root=False)
-                if child_rows:
-                    collected_data.extend(child_rows)
-                else:
-                    # No flat structure found in child - collect its data as nested columns
-                    # But don't add as separate row since parent has flat structure
-                    pass
+                stack.append([node, local_name, None, None, None, []])
+                continue
+            
+            # Flat structure: group children by name in order of first appearance
+            counts: Dict[str, int] = {}
+            for child in node:
+                child_local, _ = _extract_local_name_and_prefix(child)
+                counts[child_local] = counts.get(child_local, 0) + 1
+            repeated = {name for name, count in counts.items() if count > 1}
+            groups = {name: [] for name in counts}
+            # The parent's attributes are merged into every row
+            parent_attrs = _element_attribute_columns(node, parent_path, "_", uri_to_prefix)
+            stack.append([node, local_name, parent_attrs, repeated, groups, None])
+            continue
         
-        # If we found flat structure and collected rows, return them
-        if collected_data:
-            return collected_data
-    
-    # No flat structure at this level - recursively check children
-    # This handles nested structures where flat structure is deeper
-    for child in children:
-        child_rows = _flatten_element(child, parent_path, [], is_root=False)
-        if child_rows:
-            # If child produced rows, merge element's attributes with each row
-            if element.attrib:
-                # Collect element's attributes
-                local_name, prefix = _extract_local_name_and_prefix(element)
-                element_attrs = {}
-                for attr_name, attr_value in element.attrib.items():
-                    attr_local = attr_name
-                    attr_prefix = None
-                    if attr_name.startswith("{") and "}" in attr_name:
-                        namespace_uri, attr_local = attr_name[1:].split("}", 1)
-                        attr_prefix = _get_namespace_prefix_for_column(element, namespace_uri)
-                    attr_base_name = _build_column_name(attr_local, attr_prefix, "", "_")
-                    col_name = f"{parent_path}_@{attr_base_name}" if parent_path else f"@{attr_base_name}"
-                    element_attrs[col_name] = attr_value
-                
-                # Merge attributes into each child row
-                for child_row in child_rows:
+        if node is leaf:
+            continue
+        node, local_name, _, repeated, groups, rows = stack.pop()
+        if groups is None and rows is None:
+            # Repeated child - all nested data flattened into one row
+            parent_attrs = stack[-1][2]
+            row = _collect_row_data(node, parent_path, "_", uri_to_prefix)
+            if parent_attrs:
+                row = {**parent_attrs, **row}
+            if row:
+                stack[-1][4][local_name].append(row)
+            continue
+        
+        if groups is not None:
+            rows = [row for group_rows in groups.values() for row in group_rows]
+        elif rows:
+            # Child produced rows: merge this element's attributes into each
+            if node.attrib:
+                element_attrs = _element_attribute_columns(node, parent_path, "_", uri_to_prefix)
+                for child_row in rows:
                     child_row.update(element_attrs)
-            
-            collected_data.extend(child_rows)
         else:
-            # If child didn't produce rows, it's part of nested structure
-            # Continue recursion but don't add intermediate rows
-            pass
-    
-    # If we didn't find any flat structures in children, this might be a nested element
-    # Only add as a row if we're at root and nothing was collected, or if this element has data
-    if not collected_data or is_root:
-        row = _collect_row_data(element, parent_path if not is_root else "", "_")
-        # Only add if we have no rows yet (avoid duplicating nested data)
-        if row and not collected_data:
-            collected_data.append(row)
+            # No flat structure below, so no descendant holds data (a subtree
+            # yields rows exactly when it holds attributes or non-blank leaf
+            # text): the row is just this element's attributes, without
+            # walking the subtree again
+            row = _element_attribute_columns(node, "" if is_root and not stack else parent_path, "_", uri_to_prefix)
+            if row:
+                rows.append(row)
+        
+        if stack:
+            parent = stack[-1]
+            if parent[4] is not None:
+                parent[4][local_name].extend(rows)
+            else:
+                parent[5].extend(rows)
+        else:
+            collected_data.extend(rows)
     
     return collected_data
 
 
+def _iter_csv_chunks(rows: List[Dict[str, Any]], delimiter: str) -> Iterator[str]:
+    """
+    Render row dictionaries as CSV text, yielding it in chunks of about CSV_CHUNK_SIZE characters.
+
+    Columns are the union of all row keys in order of first appearance. Output
+    is written to a small reusable buffer, so the full CSV document is never
+    held in memory when the chunks are streamed to a client. The header needs
+    every row's keys, so rows are collected up front, but each row is released
+    as soon as it has been written: the list is emptied while the CSV streams.
+
+    Args:
+        rows (List[Dict[str, Any]]): Non-empty list of row dictionaries (consumed)
+        delimiter (str): Single-character CSV delimiter
+
+    Returns:
+        Iterator[str]: CSV text chunks (header row first)
+    """
+    # Collect all unique column names from all rows in document order (first appearance);
+    # dicts keep insertion order and re-inserting an existing key is a no-op
+    columns = list(dict.fromkeys(chain.from_iterable(rows)))
+    
+    # Use StringIO as a per-chunk buffer; newline='' as the csv module requires,
+    # so the writer's \r\n terminators are never translated
+    output = io.StringIO(newline='')
+    
+    # Create CSV writer with RFC 4180 settings and custom delimiter
+    writer = csv.writer(output, delimiter=delimiter, quoting=csv.QUOTE_MINIMAL)
+    
+    # Write header row
+    writer.writerow(columns)
+    
+    # Write data rows in batches of CSV_WRITE_BATCH_ROWS through a single
+    # writerows() call each, taking every batch off the list so written rows
+    # can be freed while a slow client is still downloading the response
+    blanks = repeat("")
+    rows.reverse()
+    while rows:
+        batch = rows[-CSV_WRITE_BATCH_ROWS:]
+        del rows[-CSV_WRITE_BATCH_ROWS:]
+        batch.reverse()
+        # Values in column order, missing values as empty strings; map() calls
+        # row.get(col, "") from C instead of a per-cell Python loop
+        writer.writerows([map(row.get, columns, blanks) for row in batch])
+        del batch
+        if output.tell() >= CSV_CHUNK_SIZE:
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate()
+    
+    remainder = output.getvalue()
+    if remainder:
+        yield remainder
+
+
+def _matched_element_to_row(element: etree._Element, path_separator: str, uri_to_prefix: Dict[str, Optional[str]]) -> Dict[str, Any]:
+    """
+    Convert an element selected by XPath into a row dictionary.
+
+    Column headers start from the matched element's name. A parent element
+    contributes its attributes and children; a leaf element contributes its
+    attributes and text.
+
+    Args:
+        element (etree._Element): Matched element (fully parsed)
+        path_separator (str): Character to use when joining nested path segments in column names
+        uri_to_prefix (Dict[str, Optional[str]]): Namespace URI to prefix map from _namespace_prefixes()
+
+    Returns:
+        Dict[str, Any]: Row dictionary (empty if the element holds no data)
+    """
+    local_name, prefix = _extract_local_name_and_prefix(element)
+    parent_path = _build_column_name(local_name, prefix, "", path_separator)
+    # Check if element has children (parent element) or is a leaf (no children)
+    if len(element):
+        # Parent element: collect data starting from this parent, but don't include
+        # the parent's own text in the row - the parent name is already in the path
+        return _collect_row_data_starting_from_children(element, parent_path, path_separator, uri_to_prefix)
+    # Leaf element: Include the element's text content and attributes
+    # This handles cases like: //element[@attr='value'] where element has no children
+    return _collect_row_data(element, parent_path, path_separator, uri_to_prefix)
+
+
+def _simple_xpath_tag(xpath: str, namespaces: Optional[Dict[str, str]]) -> Optional[str]:
+    """
+    Return the lxml tag selected by a '//name' or '//prefix:name' XPath, or None.
+
+    A prefixed name only qualifies when the prefix is in the explicit namespace
+    mapping; without one the prefixes come from the parsed document root.
+
+    Args:
+        xpath (str): XPath expression
+        namespaces (Dict[str, str], optional): Explicit namespace mapping
+
+    Returns:
+        str or None: Tag in lxml notation ("item" or "{uri}item"), or None when
+            the expression needs the general XPath engine
+    """
+    match = _SIMPLE_XPATH_RE.match(xpath)
+    if match is None:
+        return None
+    prefix, local_name = match.groups()
+    if prefix is None:
+        return local_name
+    uri = namespaces.get(prefix) if namespaces else None
+    return f"{{{uri}}}{local_name}" if uri else None
+
+
+def _collect_rows_by_tag(source: Union[str, bytes, BinaryIO], tag: str, path_separator: str, max_size: Optional[int]) -> List[Dict[str, Any]]:
+    """
+    Collect one row per element with the given tag using an incremental parse.
+
+    Equivalent to evaluating "//tag" on the full tree, but each outermost match
+    is cleared (together with its already-processed preceding siblings) once its
+    row is built, so memory holds the collected rows rather than the whole
+    document. A row slot is reserved at each start event, which keeps nested
+    matches in document order like the XPath result.
+
+    Args:
+        source (str, bytes or BinaryIO): XML document or readable binary stream
+        tag (str): Element tag in lxml notation
+        path_separator (str): Character to use when joining nested path segments in column names
+        max_size (int, optional): Maximum number of bytes to read when source is a stream
+
+    Returns:
+        List[Dict[str, Any]]: One row dictionary per non-empty match
+
+    Raises:
+        XMLValidationError: If XML is malformed or invalid
+        FileSizeExceededError: If a stream source exceeds max_size bytes
+    """
+    if isinstance(source, str):
+        source = source.encode('utf-8')
+    rows = []
+    # Indexes of the reserved row slots of currently open matches
+    open_slots = []
+    uri_to_prefix = None
+    for event, element in iterparse_xml(source, tag, max_size=max_size):
+        if event == 'start':
+            open_slots.append(len(rows))
+            rows.append(None)
+            continue
+        if uri_to_prefix is None:
+            # The root (and its namespace declarations) is parsed before any match ends
+            uri_to_prefix = _namespace_prefixes(element)
+        rows[open_slots.pop()] = _matched_element_to_row(element, path_separator, uri_to_prefix)
+        if not open_slots:
+            # Outermost match done: nothing later can reference it or its predecessors
+            element.clear(keep_tail=True)
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
+    # Only keep non-empty rows
+    return [row for row in rows if row]
+
+
+def _collect_rows_by_xpath(xml_root: etree._Element, xpath: Union[str, etree.XPath], namespaces: Optional[Dict[str, str]], path_separator: str) -> List[Dict[str, Any]]:
+    """
+    Evaluate an XPath expression and convert each match to a row dictionary.
+
+    Args:
+        xml_root (etree._Element): Root element of parsed XML tree
+        xpath (str or etree.XPath): XPath expression to select elements, or an
+            evaluator from compile_xpath() (namespaces is then ignored)
+        namespaces (Dict[str, str], optional): Namespace mapping for XPath; taken
+            from the root element when None
+        path_separator (str): Character to use when joining nested path segments in column names
+
+    Returns:
+        List[Dict[str, Any]]: One row dictionary per non-empty match
+
+    Raises:
+        ValueError: If XPath is empty
+        XPathEvaluationError: If XPath is invalid, fails to evaluate or does
+            not select nodes
+    """
+    if isinstance(xpath, etree.XPath):
+        # Precompiled by the caller (compile_xpath), namespaces already bound
+        compiled_xpath = xpath
+    else:
+        # Validate XPath is provided
+        if not xpath or not xpath.strip():
+            raise ValueError("XPath expression is required")
+
+        # Use provided namespaces or extract from root element
+        if namespaces is None:
+            # Try to extract namespaces from root element
+            namespaces = {}
+            if hasattr(xml_root, 'nsmap') and xml_root.nsmap:
+                # lxml nsmap can have None key for default namespace, filter it out
+                namespaces = {k if k else 'default': v for k, v in xml_root.nsmap.items() if k is not None}
+        compiled_xpath = None
+
+        # Name-only expressions ("//item", "//ns:item") select the same elements, in
+        # the same document order, as a plain tag iteration over the whole tree
+        tag = _simple_xpath_tag(xpath, namespaces)
+        if tag is not None:
+            return _element_rows(xml_root.getroottree().iter(tag), path_separator, _namespace_prefixes(xml_root))
+
+    # Reuse the compiled evaluator for repeated (xpath, namespaces) pairs
+    try:
+        if compiled_xpath is None:
+            compiled_xpath = _compile_xpath(xpath, tuple(sorted(namespaces.items())))
+        matched_elements = compiled_xpath(xml_root)
+    except etree.XPathError as e:
+        raise XPathEvaluationError(f"Invalid XPath expression: {str(e)}")
+    except Exception as e:
+        raise XPathEvaluationError(f"XPath evaluation error: {str(e)}")
+
+    # Scalar results (count(), boolean(), name(), ...) have no rows to build
+    if not isinstance(matched_elements, list):
+        raise XPathEvaluationError(
+            f"XPath expression must select nodes, got {type(matched_elements).__name__}"
+        )
+
+    # Check if any elements were found
+    if not matched_elements:
+        return []
+    return _rows_from_elements(matched_elements, path_separator)
+
+
+def _element_rows(elements: Iterable[etree._Element], path_separator: str, uri_to_prefix: Dict[str, Optional[str]]) -> List[Dict[str, Any]]:
+    """
+    Convert matches known to be elements (e.g. a tag iteration) to row dictionaries.
+
+    No per-match result-type dispatch is needed, so the loop runs as a map()
+    over _matched_element_to_row.
+
+    Args:
+        elements (Iterable[etree._Element]): Matched elements in document order
+        path_separator (str): Character to use when joining nested path segments in column names
+        uri_to_prefix (Dict[str, Optional[str]]): Namespace URI to prefix map from _namespace_prefixes()
+
+    Returns:
+        List[Dict[str, Any]]: One row dictionary per non-empty match
+    """
+    return [row for row in map(_matched_element_to_row, elements, repeat(path_separator), repeat(uri_to_prefix)) if row]
+
+
+def _rows_from_elements(matched_elements, path_separator: str) -> List[Dict[str, Any]]:
+    """
+    Convert XPath results (elements or string values) to row dictionaries.
+
+    Args:
+        matched_elements (Iterable): Elements, or strings for attribute/text XPaths
+        path_separator (str): Character to use when joining nested path segments in column names
+
+    Returns:
+        List[Dict[str, Any]]: One row dictionary per non-empty match
+    """
+    rows = []
+    uri_to_prefix = None
+    element_type = etree._Element
+    for element in matched_elements:
+        # Handle different XPath result types; the exact-type check catches plain
+        # elements (the common result) before the general isinstance() check
+        if type(element) is element_type or isinstance(element, element_type):
+            if uri_to_prefix is None:
+                # All matches share one document, so its namespaces are resolved once
+                uri_to_prefix = _namespace_prefixes(element)
+            row = _matched_element_to_row(element, path_separator, uri_to_prefix)
+            if row:  # Only add non-empty rows
+                rows.append(row)
+        elif isinstance(element, (str, bytes)):
+            # XPath returned a string (e.g., attribute value or text)
+            # Create a simple row with the matched value
+            row = {"value": element if isinstance(element, str) else element.decode('utf-8')}
+            rows.append(row)
+
+    return rows
+
+
 def convert_xml_to_csv(xml_root: etree._Element, delimiter: str = ',') -> str:
     """
     Convert parsed XML element tree to CSV format string.
@@ -370,36 +801,7 @@ def convert_xml_to_csv(xml_root: etree._Element, delimiter: str = ',') -> str:
         # Empty XML or no data rows
         return ""
     
-    # Collect all unique column names from all rows in document order (first appearance)
-    # Use OrderedDict to preserve insertion order (columns appear as 1, 2, 3, 4, 5... not 5, 4, 3, 2, 1)
-    from collections import OrderedDict
-    column_order = OrderedDict()
-    for row in rows:
-        for col_name in row.keys():
-            if col_name not in column_order:
-                column_order[col_name] = None
-    
-    # Convert to list preserving document order (order of first appearance)
-    columns = list(column_order.keys())
-    
-    # Use StringIO to write CSV in memory
-    output = io.StringIO()
-    
-    # Create CSV writer with RFC 4180 settings and custom delimiter
-    writer = csv.writer(output, delimiter=delimiter, quoting=csv.QUOTE_MINIMAL)
-    
-    # Write header row
-    writer.writerow(columns)
-    
-    # Write data rows
-    for row in rows:
-        # Create row list with values in same order as columns
-        # Missing values are empty strings
-        row_values = [row.get(col, "") for col in columns]
-        writer.writerow(row_values)
-    
-    # Return CSV string
-    return output.getvalue()
+    return ''.join(_iter_csv_chunks(rows, delimiter))
 
 
 def convert_xml_to_csv_by_xpath(xml_root: etree._Element, xpath: str, delimiter: str = ',', namespaces: Dict[str, str] = None, path_separator: str = '/') -> str:
@@ -435,99 +837,15 @@ def convert_xml_to_csv_by_xpath(xml_root: etree._Element, xpath: str, delimiter:
     if not delimiter or len(delimiter) != 1:
         raise ValueError(f"Delimiter must be a single character, got: {delimiter}")
     
-    # Validate XPath is provided
-    if not xpath or not xpath.strip():
-        raise ValueError("XPath expression is required")
-    
-    # Use provided namespaces or extract from root element
-    if namespaces is None:
-        # Try to extract namespaces from root element
-        namespaces = {}
-        if hasattr(xml_root, 'nsmap') and xml_root.nsmap:
-            # lxml nsmap can have None key for default namespace, filter it out
-            namespaces = {k if k else 'default': v for k, v in xml_root.nsmap.items() if k is not None}
-    
-    # Execute XPath query to find matching elements
-    try:
-        matched_elements = xml_root.xpath(xpath, namespaces=namespaces)
-    except etree.XPathEvalError as e:
-        raise XMLValidationError(f"Invalid XPath expression: {str(e)}")
-    except Exception as e:
-        raise XMLValidationError(f"XPath evaluation error: {str(e)}")
-    
-    # Check if any elements were found
-    if not matched_elements:
-        # Return empty CSV with just headers (if we can determine them) or empty string
-        return ""
-    
-    # Convert each matched element to a row dictionary
-    rows = []
-    for element in matched_elements:
-        # Handle different XPath result types
-        if isinstance(element, etree._Element):
-            # Check if element has children (parent element) or is a leaf (no children)
-            children = list(element)
-            
-            if children:
-                # Parent element: Start path with the matched element's name (parent of all headers)
-                # This ensures column headers start from the matched XPath element, not root
-                local_name, prefix = _extract_local_name_and_prefix(element)
-                parent_path = _build_column_name(local_name, prefix, "", path_separator)
-                # Collect data starting from this parent, but don't include the parent's own text/attrs in the row
-                # Only process children - the parent name is already in the path
-                row = _collect_row_data_starting_from_children(element, parent_path, path_separator)
-            else:
-                # Leaf element: Include the element's text content and attributes
-                # This handles cases like: //element[@attr='value'] where element has no children
-                local_name, prefix = _extract_local_name_and_prefix(element)
-                parent_path = _build_column_name(local_name, prefix, "", path_separator)
-                row = _collect_row_data(element, parent_path, path_separator)
-            
-            if row:  # Only add non-empty rows
-                rows.append(row)
-        elif isinstance(element, (str, bytes)):
-            # XPath returned a string (e.g., attribute value or text)
-            # Create a simple row with the matched value
-            row = {"value": element if isinstance(element, str) else element.decode('utf-8')}
-            rows.append(row)
-        # Note: XPath can also return other types (numbers, booleans), but we'll handle those as strings
+    rows = _collect_rows_by_xpath(xml_root, xpath, namespaces, path_separator)
     
     if not rows:
         return ""
     
-    # Collect all unique column names from all rows in document order (first appearance)
-    # Use OrderedDict to preserve insertion order (columns appear as 1, 2, 3, 4, 5... not 5, 4, 3, 2, 1)
-    from collections import OrderedDict
-    column_order = OrderedDict()
-    for row in rows:
-        for col_name in row.keys():
-            if col_name not in column_order:
-                column_order[col_name] = None
-    
-    # Convert to list preserving document order (order of first appearance)
-    columns = list(column_order.keys())
-    
-    # Use StringIO to write CSV in memory
-    output = io.StringIO()
-    
-    # Create CSV writer with RFC 4180 settings and custom delimiter
-    writer = csv.writer(output, delimiter=delimiter, quoting=csv.QUOTE_MINIMAL)
-    
-    # Write header row
-    writer.writerow(columns)
-    
-    # Write data rows
-    for row in rows:
-        # Create row list with values in same order as columns
-        # Missing values are empty strings
-        row_values = [row.get(col, "") for col in columns]
-        writer.writerow(row_values)
-    
-    # Return CSV string
-    return output.getvalue()
+    return ''.join(_iter_csv_chunks(rows, delimiter))
 
 
-def convert_xml_string_to_csv(xml_string: str, delimiter: str = ',') -> str:
+def convert_xml_string_to_csv(xml_string: Union[str, bytes], delimiter: str = ',') -> str:
     """
     Convert XML string to CSV format string.
     
@@ -536,7 +854,7 @@ def convert_xml_string_to_csv(xml_string: str, delimiter: str = ',') -> str:
     Handles XMLValidationError exceptions from parsing.
     
     Args:
-        xml_string (str): XML content as a string
+        xml_string (str or bytes): XML content as a string or raw bytes
         delimiter (str): CSV delimiter character (default: ','). Must be a single character.
         
     Returns:
@@ -570,7 +888,7 @@ def convert_xml_string_to_csv(xml_string: str, delimiter: str = ',') -> str:
         raise XMLValidationError(f"Failed to convert XML to CSV: {str(e)}")
 
 
-def convert_xml_string_to_csv_by_xpath(xml_string: str, xpath: str, delimiter: str = ',', namespaces: Dict[str, str] = None, path_separator: str = '/') -> str:
+def convert_xml_string_to_csv_by_xpath(xml_string: Union[str, bytes], xpath: str, delimiter: str = ',', namespaces: Dict[str, str] = None, path_separator: str = '/') -> str:
     """
     Convert XML string to CSV format using XPath to select specific elements.
     
@@ -579,7 +897,7 @@ def convert_xml_string_to_csv_by_xpath(xml_string: str, xpath: str, delimiter: s
     Handles XMLValidationError exceptions from parsing and XPath evaluation.
     
     Args:
-        xml_string (str): XML content as a string
+        xml_string (str or bytes): XML content as a string or raw bytes
         xpath (str): XPath expression to select elements (e.g., "//wd:Job_Requisition")
         delimiter (str): CSV delimiter character (default: ','). Must be a single character.
         namespaces (Dict[str, str], optional): Namespace mapping for XPath
@@ -613,3 +931,106 @@ def convert_xml_string_to_csv_by_xpath(xml_string: str, xpath: str, delimiter: s
         # Wrap unexpected errors
         raise XMLValidationError(f"Failed to convert XML to CSV using XPath: {str(e)}")
 
+
+def _parse_source(source: Union[str, bytes, BinaryIO], max_size: Optional[int]) -> etree._Element:
+    """Parse XML from a string/bytes document or from a readable binary stream."""
+    if hasattr(source, 'read'):
+        return parse_xml_stream(source, max_size=max_size)
+    return parse_xml(source)
+
+
+def convert_xml_to_csv_chunks(source: Union[str, bytes, BinaryIO], delimiter: str = ',', max_size: Optional[int] = None) -> Tuple[int, Iterator[str]]:
+    """
+    Convert XML to CSV text delivered as an iterator of chunks.
+
+    Parsing and row collection happen before this function returns, so XML and
+    delimiter errors are raised here rather than while the chunks are consumed.
+    The CSV text itself is produced lazily, which lets a route stream it to the
+    client without ever building the complete output string.
+
+    Args:
+        source (str, bytes or BinaryIO): XML document, or a readable binary
+            stream such as request.stream
+        delimiter (str): CSV delimiter character (default: ','). Must be a single character.
+        max_size (int, optional): Maximum number of bytes to read when source is a stream
+
+    Returns:
+        Tuple[int, Iterator[str]]: Number of data rows and the CSV text chunks
+            (empty iterator when there are no rows)
+
+    Raises:
+        XMLValidationError: If XML is malformed or invalid
+        FileSizeExceededError: If a stream source exceeds max_size bytes
+        ValueError: If delimiter is not a single character
+
+    Example:
+        row_count, chunks = convert_xml_to_csv_chunks(request.stream, delimiter=';')
+        return Response(chunks, mimetype='text/csv')
+    """
+    if not delimiter or len(delimiter) != 1:
+        raise ValueError(f"Delimiter must be a single character, got: {delimiter}")
+    try:
+        rows = _flatten_element(_parse_source(source, max_size), is_root=True)
+    except (XMLValidationError, FileSizeExceededError):
+        # Re-raise with original details
+        raise
+    except Exception as e:
+        # Wrap unexpected errors
+        raise XMLValidationError(f"Failed to convert XML to CSV: {str(e)}")
+    if not rows:
+        return 0, iter(())
+    return len(rows), _iter_csv_chunks(rows, delimiter)
+
+
+def convert_xml_to_csv_chunks_by_xpath(source: Union[str, bytes, BinaryIO], xpath: Union[str, etree.XPath], delimiter: str = ',', namespaces: Dict[str, str] = None, path_separator: str = '/', max_size: Optional[int] = None) -> Tuple[int, Iterator[str]]:
+    """
+    Convert XML elements selected by XPath to CSV text delivered as an iterator of chunks.
+
+    XPath counterpart of convert_xml_to_csv_chunks(): parsing, XPath evaluation
+    and row collection happen eagerly, CSV rendering happens lazily. Expressions
+    that only select elements by name ("//item", or "//wd:Job_Requisition" with
+    an explicit namespace mapping) are answered with an incremental parse that
+    discards each match once its row is built, instead of a full tree.
+
+    Args:
+        source (str, bytes or BinaryIO): XML document, or a readable binary
+            stream such as request.stream
+        xpath (str or etree.XPath): XPath expression to select elements (e.g.,
+            "//wd:Job_Requisition"), or an evaluator returned by compile_xpath()
+        delimiter (str): CSV delimiter character (default: ','). Must be a single character.
+        namespaces (Dict[str, str], optional): Namespace mapping for XPath (unused
+            when xpath is precompiled)
+        path_separator (str): Character to use when joining nested path segments in column names (default: '/')
+        max_size (int, optional): Maximum number of bytes to read when source is a stream
+
+    Returns:
+        Tuple[int, Iterator[str]]: Number of extracted rows and the CSV text chunks
+            (empty iterator when nothing matched)
+
+    Raises:
+        XMLValidationError: If XML is malformed or XPath is invalid
+        FileSizeExceededError: If a stream source exceeds max_size bytes
+        ValueError: If delimiter is not a single character or XPath is empty
+
+    Example:
+        row_count, chunks = convert_xml_to_csv_chunks_by_xpath(xml_bytes, "//item")
+    """
+    if not delimiter or len(delimiter) != 1:
+        raise ValueError(f"Delimiter must be a single character, got: {delimiter}")
+    # Name-only expressions skip the full tree and the XPath engine
+    tag = _simple_xpath_tag(xpath, namespaces) if isinstance(xpath, str) else None
+    try:
+        if tag is not None:
+            rows = _collect_rows_by_tag(source, tag, path_separator, max_size)
+        else:
+            xml_root = _parse_source(source, max_size)
+            rows = _collect_rows_by_xpath(xml_root, xpath, namespaces, path_separator)
+    except (XMLValidationError, FileSizeExceededError, ValueError):
+        # Re-raise with original details
+        raise
+    except Exception as e:
+        # Wrap unexpected errors
+        raise XMLValidationError(f"Failed to convert XML to CSV using XPath: {str(e)}")
+    if not rows:
+        return 0, iter(())
+    return len(rows), _iter_csv_chunks(rows, delimiter)
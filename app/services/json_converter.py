@@ -6,42 +6,73 @@ preserving elements, attributes, namespaces, hierarchy, and data types.
 """
 
 import json
-from typing import Dict, Any, List, Union, Optional, Tuple
+import re
+import sys
+from functools import lru_cache
+from typing import Dict, Any, List, Union, Optional, Tuple, BinaryIO
 from lxml import etree
 
-from app.services.xml_parser import parse_xml, parse_xml_streaming
-from app.exceptions import XMLValidationError
+from app.services.xml_parser import parse_xml, parse_xml_streaming, parse_xml_stream
+from app.exceptions import XMLValidationError, FileSizeExceededError
 
+# Maximum number of distinct tag strings whose split form is cached
+TAG_CACHE_SIZE = 4096
 
-def _extract_local_name_and_prefix(element: etree._Element) -> Tuple[str, Optional[str]]:
+# Text classifiers for _preserve_data_types(), matched against the stripped text with
+# the grammar int()/float() accept: Unicode decimal digits with single "_" separators,
+# an optional sign, and for floats a fractional part and/or an exponent
+_DIGITS = r'\d(?:_?\d)*'
+_INT_TEXT = re.compile(rf'[+-]?{_DIGITS}')
+_FLOAT_TEXT = re.compile(rf'[+-]?(?:{_DIGITS}(?:\.(?:{_DIGITS})?)?|\.{_DIGITS})(?:[eE][+-]?{_DIGITS})?')
+_BOOLEAN_TEXT = {"true": True, "false": False}
+
+
+@lru_cache(maxsize=TAG_CACHE_SIZE)
+def _split_tag(tag: str) -> Tuple[str, Optional[str], bool]:
     """
-    Extract local name and prefix from XML element.
-    
+    Split a tag string into its local name and textual prefix, once per distinct tag.
+
+    Documents repeat a small set of tag names across many elements, so the
+    string parsing is cached by tag rather than redone for every element.
+
     Args:
-        element: XML element from lxml
-        
+        tag (str): Element tag ("{uri}local", "prefix:local" or "local")
+
     Returns:
-        Tuple of (local_name, prefix)
+        Tuple[str, Optional[str], bool]: (local_name, prefix written in the tag,
+            whether the tag is in Clark "{uri}local" notation)
     """
-    tag = element.tag
-    
-    # Try to get prefix from element (lxml provides this for prefixed namespaces)
-    prefix = element.prefix if hasattr(element, 'prefix') else None
-    
     # Handle lxml's namespace format: "{namespace}localname"
     if tag.startswith("{") and "}" in tag:
-        local_name = tag.split("}", 1)[1]
-        # If we have a prefix from element.prefix, use it
-        # Otherwise, it's a default namespace (prefix is None)
-        return local_name, prefix
-    
+        return tag.split("}", 1)[1], None, True
+
     # Handle prefixed namespace: "prefix:localname" (shouldn't happen with lxml, but handle it)
     if ":" in tag:
         prefix, local_name = tag.split(":", 1)
-        return local_name, prefix
-    
+        return local_name, prefix, False
+
     # No namespace
-    return tag, None
+    return tag, None, False
+
+
+def _extract_local_name_and_prefix(element: etree._Element) -> Tuple[str, Optional[str]]:
+    """
+    Extract local name and prefix from XML element.
+    
+    Args:
+        element: XML element from lxml
+        
+    Returns:
+        Tuple of (local_name, prefix)
+    """
+    local_name, prefix, namespaced = _split_tag(element.tag)
+    if namespaced:
+        # The prefix in use is only known to the element (lxml provides it for
+        # prefixed namespaces; None means a default namespace). lxml returns a new
+        # string per call, so intern it to share one copy across the result
+        prefix = element.prefix
+        return local_name, prefix and sys.intern(prefix)
+    return local_name, prefix
 
 
 def _get_prefix_from_namespace(element: etree._Element, namespace_uri: str) -> Optional[str]:
@@ -64,6 +95,25 @@ def _get_prefix_from_namespace(element: etree._Element, namespace_uri: str) -> O
     return None
 
 
+def _reverse_nsmap(nsmap: Dict[Optional[str], str]) -> Dict[str, Optional[str]]:
+    """
+    Build a namespace URI to prefix map from an element's nsmap.
+
+    Args:
+        nsmap (Dict[Optional[str], str]): Element's namespace map (prefix to URI)
+
+    Returns:
+        Dict[str, Optional[str]]: URI to prefix (None for the default namespace).
+            When several prefixes share a URI the first one in nsmap order wins,
+            as in a forward scan of the nsmap.
+    """
+    uri_to_prefix = {}
+    for ns_prefix, ns_uri in nsmap.items():
+        # Interned: the prefix ends up in the result of every attribute using it
+        uri_to_prefix.setdefault(ns_uri, ns_prefix and sys.intern(ns_prefix))
+    return uri_to_prefix
+
+
 def convert_xml_to_json(xml_root: etree._Element) -> Dict[str, Any]:
     """
     Convert parsed XML element tree to JSON-serializable dictionary.
@@ -91,12 +141,19 @@ def convert_xml_to_json(xml_root: etree._Element) -> Dict[str, Any]:
     return {root_local_name: element_dict}
 
 
-def _element_to_dict(element: etree._Element) -> Dict[str, Any]:
+def _element_to_dict(element: etree._Element, parent_nsmap: Optional[Dict[Optional[str], str]] = None) -> Dict[str, Any]:
     """
-    Recursively convert XML element to dictionary.
+    Convert XML element (and its subtree) to dictionary.
+
+    The tree is walked iteratively in post-order with an explicit stack of
+    child iterators, so deep documents cannot hit Python's recursion limit and
+    no interpreter frame is pushed per element. Each element's dictionary is
+    attached to its parent once the element's subtree is complete.
 
     Args:
         element (etree._Element): XML element to convert
+        parent_nsmap (Dict[Optional[str], str], optional): nsmap of the element's
+            parent; looked up from the parent when None.
 
     Returns:
         Dict[str, Any]: Dictionary representation with format:
@@ -106,6 +163,61 @@ def _element_to_dict(element: etree._Element) -> Dict[str, Any]:
             - _text for text content
             - _xmlns:prefix for namespace declarations
     """
+    # Get parent's nsmap for comparison (descendants receive it from the walk).
+    # The root has no parent, so all namespaces in its nsmap are declared on it
+    if parent_nsmap is None:
+        parent = element.getparent()
+        parent_nsmap = {} if parent is None else (parent.nsmap or {})
+
+    root_result, element_nsmap, text_content, _ = _open_element(element, parent_nsmap)
+    # Frame per open element: [child iterator, result dict, nsmap, text content, local name]
+    stack = [[iter(element), root_result, element_nsmap, text_content, None]]
+    while stack:
+        frame = stack[-1]
+        child = next(frame[0], None)
+        if child is not None:
+            child_dict, child_nsmap, child_text, child_local_name = _open_element(child, frame[2])
+            stack.append([iter(child), child_dict, child_nsmap, child_text, child_local_name])
+            continue
+
+        # All children done - finish this element
+        stack.pop()
+        _, result, _, text_content, local_name = frame
+        # Handle text content - always use _text field
+        # Keep all text as strings to match the requested format
+        if text_content:
+            result["_text"] = text_content
+        if not stack:
+            break
+
+        parent_result = stack[-1][1]
+        # If tag already exists, convert to array (multiple elements with same local name)
+        if local_name in parent_result:
+            # Convert existing value to array if not already
+            if not isinstance(parent_result[local_name], list):
+                parent_result[local_name] = [parent_result[local_name]]
+            parent_result[local_name].append(result)
+        else:
+            parent_result[local_name] = result
+
+    return root_result
+
+
+def _open_element(element: etree._Element, parent_nsmap: Dict[Optional[str], str]) -> Tuple[Dict[str, Any], Dict[Optional[str], str], str, str]:
+    """
+    Start the dictionary of one element: prefix, namespace declarations and attributes.
+
+    Children and text are added by _element_to_dict once the element's
+    subtree has been converted.
+
+    Args:
+        element (etree._Element): XML element to convert
+        parent_nsmap (Dict[Optional[str], str]): nsmap of the element's parent
+
+    Returns:
+        Tuple of (partial result dict, element's nsmap, stripped direct text,
+        local name) - the local name is returned so the tag is split only once
+    """
     # Extract local name and prefix from element
     local_name, prefix = _extract_local_name_and_prefix(element)
     
@@ -119,25 +231,11 @@ def _element_to_dict(element: etree._Element) -> Dict[str, Any]:
     # Get text content (direct text, not from children)
     text_content = (element.text or "").strip()
 
-    # Get all child elements
-    children = list(element)
-
     # Handle namespace declarations first (before regular attributes)
     # lxml doesn't include xmlns in element.attrib, but we can detect them
     # by comparing element's nsmap with parent's nsmap
     element_nsmap = getattr(element, 'nsmap', {}) or {}
-    
-    # Get parent's nsmap for comparison
-    parent_nsmap = {}
-    parent = element.getparent()
-    if parent is not None:
-        parent_nsmap = getattr(parent, 'nsmap', {}) or {}
-    elif element == element.getroottree().getroot() if hasattr(element, 'getroottree') else element:
-        # This is the root element - all namespaces in its nsmap are declared on it
-        parent_nsmap = {}
-    
-    xmlns_attrs = set()  # Keep for consistency, though we won't use it for xmlns
-    
+
     # Find namespaces declared on this element (in element_nsmap but not in parent_nsmap)
     for ns_prefix, ns_uri in element_nsmap.items():
         # Check if this namespace is declared on this element (not inherited)
@@ -145,12 +243,14 @@ def _element_to_dict(element: etree._Element) -> Dict[str, Any]:
             if ns_prefix is None:
                 # Default namespace
                 result["_xmlns"] = ns_uri
-        else:
-                result[f"_xmlns:{ns_prefix}"] = ns_uri
+            else:
+                result["_xmlns:" + ns_prefix] = ns_uri
     
     # Handle attributes - store as attrname with prefix and value inside
     # (xmlns attributes are not in element.attrib, they're handled above via nsmap)
-    for attr_name, attr_value in element.attrib.items():
+    uri_to_prefix = None
+    # items() reads the attributes without creating an _Attrib proxy
+    for attr_name, attr_value in element.items():
             
         # Extract prefix from attribute name if it has one
         # lxml stores namespaced attributes as "{namespace}attrname"
@@ -161,13 +261,11 @@ def _element_to_dict(element: etree._Element) -> Dict[str, Any]:
         if attr_name.startswith("{") and "}" in attr_name:
             # Namespace-qualified attribute: "{namespace}attrname"
             namespace_uri, attr_local_name = attr_name[1:].split("}", 1)
-            # Find prefix for this namespace URI from element's namespace map
-            element_nsmap_for_attr = getattr(element, 'nsmap', {}) or {}
-            # Reverse lookup: find prefix for this URI
-            for ns_prefix, ns_uri in element_nsmap_for_attr.items():
-                if ns_uri == namespace_uri:
-                    attr_prefix = ns_prefix if ns_prefix is not None else None
-                    break
+            # Find prefix for this namespace URI from element's namespace map,
+            # reversed once per element on the first namespaced attribute
+            if uri_to_prefix is None:
+                uri_to_prefix = _reverse_nsmap(element_nsmap)
+            attr_prefix = uri_to_prefix.get(namespace_uri)
         elif ":" in attr_name:
             # Prefixed attribute (shouldn't happen with lxml, but handle it): "prefix:attrname"
             attr_prefix, attr_local_name = attr_name.split(":", 1)
@@ -183,26 +281,7 @@ def _element_to_dict(element: etree._Element) -> Dict[str, Any]:
         # Use local name as the key (attrname as main key)
         result[attr_local_name] = attr_obj
     
-    # Process children - use local names as keys
-    for child in children:
-        child_dict = _element_to_dict(child)
-        child_local_name, _ = _extract_local_name_and_prefix(child)
-
-        # If tag already exists, convert to array (multiple elements with same local name)
-        if child_local_name in result:
-            # Convert existing value to array if not already
-            if not isinstance(result[child_local_name], list):
-                result[child_local_name] = [result[child_local_name]]
-            result[child_local_name].append(child_dict)
-        else:
-            result[child_local_name] = child_dict
-
-    # Handle text content - always use _text field
-    # Keep all text as strings to match the requested format
-    if text_content:
-        result["_text"] = text_content
-
-    return result
+    return result, element_nsmap, text_content, local_name
 
 
 def _preserve_data_types(value: str) -> Union[str, int, float, bool]:
@@ -210,7 +289,9 @@ def _preserve_data_types(value: str) -> Union[str, int, float, bool]:
     Attempt to preserve data types when converting text content.
 
     Tries to convert string values to appropriate Python types (int, float, bool)
-    while preserving as string if conversion doesn't make sense.
+    while preserving as string if conversion doesn't make sense. The value is
+    classified by precompiled patterns, so text that stays a string never
+    raises and catches a conversion error.
 
     Args:
         value (str): Text value from XML (already stripped)
@@ -221,46 +302,29 @@ def _preserve_data_types(value: str) -> Union[str, int, float, bool]:
     if not value:
         return value
 
-    # Try boolean detection (common XML/JSON patterns)
-    value_lower = value.lower()
-    if value_lower in ("true", "false"):
-        return value_lower == "true"
-
-    # Try integer (only if no decimal point)
-    # But preserve leading zeros as strings (e.g., "007", "01")
-    try:
-        if "." not in value and "e" not in value_lower and "E" not in value:
-            # Check for leading zeros (preserve as string)
-            stripped = value.lstrip("-+")
-            if stripped.startswith("0") and len(stripped) > 1 and stripped != "0":
-                # Has leading zeros and not just "0", preserve as string
-                return value
-            
-            int_val = int(value)
-            # Verify it's not just a number that happened to parse as int
-            # but should be a string
-            if value.lstrip("-+").lstrip("0") == str(int_val).lstrip("-").lstrip("0") or value == "0":
-                return int_val
-    except ValueError:
-        pass
-
-    # Try float
-    try:
-        float_val = float(value)
-        # Check if it's actually a float (not just an int)
-        if "." in value or "e" in value_lower or "E" in value:
-            return float_val
-        # If it's an integer-looking float, return as int
-        if float_val.is_integer():
-            return int(float_val)
-    except ValueError:
-        pass
-
-    # Return as string if no conversion works
+    # Boolean detection (common XML/JSON patterns)
+    boolean = _BOOLEAN_TEXT.get(value.lower())
+    if boolean is not None:
+        return boolean
+
+    # Surrounding whitespace (e.g. from pretty-printed XML) is ignored, as by int()/float()
+    text = value.strip()
+    if _INT_TEXT.fullmatch(text):
+        # Integers keep leading zeros as strings (e.g., "007", "01")
+        digits = value.lstrip("-+")
+        if digits[0] == "0" and digits != "0":
+            return value
+        return int(text)
+
+    # Anything else numeric has a decimal point or an exponent
+    if _FLOAT_TEXT.fullmatch(text):
+        return float(text)
+
+    # Return as string if no conversion applies
     return value
 
 
-def convert_xml_string_to_json(xml_string: str, use_streaming: bool = None) -> Dict[str, Any]:
+def convert_xml_string_to_json(xml_string: Union[str, bytes], use_streaming: bool = None) -> Dict[str, Any]:
     """
     Convert XML string to JSON-serializable dictionary.
 
@@ -270,7 +334,7 @@ def convert_xml_string_to_json(xml_string: str, use_streaming: bool = None) -> D
     exceptions from parsing.
 
     Args:
-        xml_string (str): XML content as a string
+        xml_string (str or bytes): XML content as a string or raw UTF-8/declared-encoding bytes
         use_streaming (bool, optional): Force use of streaming parser.
             If None (default), automatically chooses based on file size:
             - Files > 10MB: uses streaming parser
@@ -292,9 +356,14 @@ def convert_xml_string_to_json(xml_string: str, use_streaming: bool = None) -> D
         # Default threshold: 10MB (10485760 bytes) for switching to streaming
         STREAMING_THRESHOLD = 10 * 1024 * 1024  # 10MB in bytes
         
+        # Encode str input once here; the parsers take bytes as-is, so the
+        # size check and the parse share a single encoded copy
+        if not isinstance(xml_string, bytes):
+            xml_string = xml_string.encode('utf-8')
+
         if use_streaming is None:
             # Auto-detect: use streaming for large files
-            use_streaming = len(xml_string.encode('utf-8')) > STREAMING_THRESHOLD
+            use_streaming = len(xml_string) > STREAMING_THRESHOLD
         elif use_streaming:
             # Explicitly requested streaming
             use_streaming = True
@@ -314,3 +383,35 @@ def convert_xml_string_to_json(xml_string: str, use_streaming: bool = None) -> D
         # Wrap unexpected errors
         raise XMLValidationError(f"Failed to convert XML to JSON: {str(e)}")
 
+
+def convert_xml_stream_to_json(stream: BinaryIO, max_size: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Convert XML read from a binary stream to JSON-serializable dictionary.
+
+    Streaming counterpart of convert_xml_string_to_json() for large request
+    bodies: the stream is parsed incrementally with parse_xml_stream(), so the
+    body is never materialized as a single string before conversion.
+
+    Args:
+        stream (BinaryIO): Readable binary stream containing XML (e.g. request.stream)
+        max_size (int, optional): Maximum number of bytes to read from the stream
+
+    Returns:
+        Dict[str, Any]: JSON-serializable dictionary representing XML structure
+
+    Raises:
+        XMLValidationError: If XML is malformed or invalid (from parsing)
+        FileSizeExceededError: If the stream exceeds max_size bytes
+
+    Example:
+        result = convert_xml_stream_to_json(request.stream, max_size=Config.MAX_FILE_SIZE)
+    """
+    try:
+        xml_root = parse_xml_stream(stream, max_size=max_size)
+        return convert_xml_to_json(xml_root)
+    except (XMLValidationError, FileSizeExceededError):
+        # Re-raise with original details
+        raise
+    except Exception as e:
+        # Wrap unexpected errors
+        raise XMLValidationError(f"Failed to convert XML to JSON: {str(e)}")
@@ -7,16 +7,55 @@ and structure, returning parsed element trees or raising XMLValidationError
 with detailed error location information.
 
 For large files (typically >10MB), use parse_xml_streaming() instead of
-parse_xml() to enable memory-efficient streaming parsing.
+parse_xml() to enable memory-efficient streaming parsing. When the XML is still
+arriving on a binary stream (e.g. an HTTP request body), use parse_xml_stream()
+to parse it chunk by chunk without buffering the whole document first.
+iterparse_xml() exposes the same incremental parse as start/end events for a
+single tag, for callers that process and discard elements as they complete.
 """
 
-from typing import Iterator, BinaryIO
+import threading
+from typing import Iterator, BinaryIO, Optional, Union
 from io import BytesIO
 from lxml import etree
-from app.exceptions import XMLValidationError
+from app.exceptions import XMLValidationError, FileSizeExceededError
 
+# Chunk size used when feeding a binary stream to the incremental parser
+STREAM_CHUNK_SIZE = 64 * 1024  # 64KB
 
-def parse_xml(xml_string: str) -> etree._Element:
+# Per-thread parser storage: lxml parsers are not thread-safe, but one parser
+# can be reused for any number of sequential fromstring() calls
+_tls = threading.local()
+
+
+def _get_parser() -> etree.XMLParser:
+    """
+    Return this thread's reusable XMLParser for parse_xml(), creating it on first use.
+
+    Reusing the parser avoids allocating fresh libxml2 parser state for every
+    request; lxml resets the parser context (and its error log) at the start
+    of each parse, so no state leaks from one document to the next.
+
+    Returns:
+        etree.XMLParser: Parser configured with the parse_xml() security settings
+    """
+    parser = getattr(_tls, 'parser', None)
+    if parser is None:
+        # Configure parser with security settings to prevent XML attack vectors:
+        # - resolve_entities=False: Prevents entity expansion attacks (billion laughs, etc.)
+        # - huge_tree=False: Prevents quadratic blowup attacks with very large trees
+        # - no_network=True: Never fetch external resources referenced by the document
+        # - collect_ids=False: Skip building the xml:id hash table (IDs are never looked up)
+        parser = _tls.parser = etree.XMLParser(
+            resolve_entities=False,
+            huge_tree=False,
+            no_network=True,
+            collect_ids=False
+        )
+    return parser
+
+
+def parse_xml(xml_string: Union[str, bytes]) -> etree._Element:
     """
     Parse and validate XML string.
 
@@ -26,7 +65,8 @@ def parse_xml(xml_string: str) -> etree._Element:
     location information if parsing fails.
 
     Args:
-        xml_string (str): XML content as a string (assumed UTF-8 encoded)
+        xml_string (str or bytes): XML content as a string, or raw bytes as
+            received (bytes are parsed as-is, honoring the XML declaration)
 
     Returns:
         etree._Element: Parsed XML element tree root element
@@ -35,20 +75,16 @@ def parse_xml(xml_string: str) -> etree._Element:
         XMLValidationError: If XML is malformed or invalid, includes
             error message and location (line/column) information
     """
-    # Configure parser with security settings to prevent XML attack vectors:
-    # - resolve_entities=False: Prevents entity expansion attacks (billion laughs, etc.)
-    # - huge_tree=False: Prevents quadratic blowup attacks with very large trees
-    parser = etree.XMLParser(
-        resolve_entities=False,
-        huge_tree=False
-    )
+    # Reused per thread; see _get_parser() for the security settings
+    parser = _get_parser()
 
     try:
         # Parse XML string - lxml automatically handles:
         # - UTF-8 encoding (default for XML)
         # - Namespace preservation (default behavior)
         # - XML syntax validation (raises exception on invalid XML)
-        root = etree.fromstring(xml_string.encode('utf-8'), parser=parser)
+        xml_bytes = xml_string if isinstance(xml_string, bytes) else xml_string.encode('utf-8')
+        root = etree.fromstring(xml_bytes, parser=parser)
         return root
 
     except etree.XMLSyntaxError as e:
@@ -69,7 +105,7 @@ def parse_xml(xml_string: str) -> etree._Element:
         raise XMLValidationError(error_message)
 
 
-def parse_xml_streaming(xml_string: str) -> etree._Element:
+def parse_xml_streaming(xml_string: Union[str, bytes]) -> etree._Element:
     """
     Parse XML string using streaming approach for memory efficiency.
 
@@ -83,7 +119,7 @@ def parse_xml_streaming(xml_string: str) -> etree._Element:
     automatically. Security settings are applied to prevent XML attack vectors.
 
     Args:
-        xml_string (str): XML content as a string (assumed UTF-8 encoded)
+        xml_string (str or bytes): XML content as a string, or raw bytes as received
 
     Returns:
         etree._Element: Root element of parsed XML tree (fully built)
@@ -107,11 +143,12 @@ def parse_xml_streaming(xml_string: str) -> etree._Element:
     try:
         # Create a BytesIO object from the XML string for iterparse
         # iterparse requires a file-like object or file path
-        xml_bytes = xml_string.encode('utf-8')
+        xml_bytes = xml_string if isinstance(xml_string, bytes) else xml_string.encode('utf-8')
         xml_stream = BytesIO(xml_bytes)
 
         # Use iterparse for streaming parsing with security and performance settings
-        # events=('end',) means we get elements when they are fully parsed
+        # events=() reports no elements: the caller needs the complete tree, so
+        # nothing is gained from a Python-level step per element
         # Security settings:
         #   - huge_tree=True: Required for large files (allows processing files > 300MB)
         #   - no_network=True: Default, prevents network access (entity attacks)
@@ -120,24 +157,19 @@ def parse_xml_streaming(xml_string: str) -> etree._Element:
         # but no_network=True and load_dtd=False provide similar protection
         context = etree.iterparse(
             xml_stream,
-            events=('end',),
+            events=(),
             huge_tree=True,  # Required for large files with iterparse
+            resolve_entities=False,  # Security: no entity expansion
             no_network=True,  # Security: prevent network access
-            load_dtd=False    # Security: don't load external DTDs
+            load_dtd=False,   # Security: don't load external DTDs
+            collect_ids=False  # Skip the xml:id hash table (IDs are never looked up)
         )
 
-        root = None
-        # Iterate through parsed elements to build tree incrementally
-        # iterparse builds the tree incrementally as it processes the XML
-        # We need to find the root element (the one without a parent)
-        for event, element in context:
-            if event == 'end':
-                # Track root element (element without a parent)
-                if root is None:
-                    # Check if this is the root (has no parent)
-                    parent = element.getparent()
-                    if parent is None:
-                        root = element
+        # Drive the parse to completion; iterparse builds the tree incrementally
+        # and exposes its root once the document has been read
+        for _ in context:
+            pass
+        root = context.root
 
         if root is None:
             raise XMLValidationError("Empty XML document")
@@ -162,3 +194,159 @@ def parse_xml_streaming(xml_string: str) -> etree._Element:
         error_message = f"Failed to parse XML: {str(e)}"
         raise XMLValidationError(error_message)
 
+
+def parse_xml_stream(stream: BinaryIO, max_size: Optional[int] = None) -> etree._Element:
+    """
+    Parse XML incrementally from a binary stream.
+
+    Reads the stream in STREAM_CHUNK_SIZE chunks and feeds each chunk to an
+    lxml feed parser, so parsing overlaps with reading and the raw document
+    is never held in memory as a single bytes/str object. Bytes are counted
+    while reading so oversized input is rejected mid-stream.
+
+    Args:
+        stream (BinaryIO): Readable binary stream containing the XML document
+        max_size (int, optional): Maximum number of bytes to read. If exceeded,
+            FileSizeExceededError is raised. No limit when None.
+
+    Returns:
+        etree._Element: Root element of parsed XML tree
+
+    Raises:
+        XMLValidationError: If XML is malformed or invalid, includes
+            error message and location (line/column) information
+        FileSizeExceededError: If the stream yields more than max_size bytes
+
+    Example:
+        root = parse_xml_stream(request.stream, max_size=Config.MAX_FILE_SIZE)
+    """
+    # Same security settings as the other parsers; huge_tree=True matches
+    # parse_xml_streaming since this path is used for large request bodies
+    parser = etree.XMLParser(
+        resolve_entities=False,
+        huge_tree=True,
+        no_network=True,
+        load_dtd=False,
+        collect_ids=False
+    )
+
+    try:
+        bytes_read = 0
+        while True:
+            chunk = stream.read(STREAM_CHUNK_SIZE)
+            if not chunk:
+                break
+            bytes_read += len(chunk)
+            if max_size is not None and bytes_read > max_size:
+                raise FileSizeExceededError(
+                    f"Request size exceeds maximum limit of {max_size} bytes",
+                    max_size_bytes=max_size,
+                    actual_size_bytes=bytes_read
+                )
+            parser.feed(chunk)
+
+        if bytes_read == 0:
+            raise XMLValidationError("Empty XML document")
+
+        return parser.close()
+
+    except etree.XMLSyntaxError as e:
+        # Extract error location information from lxml exception
+        line = e.lineno if hasattr(e, 'lineno') and e.lineno is not None else None
+        column = e.offset if hasattr(e, 'offset') and e.offset is not None else None
+
+        # Extract error message from lxml exception
+        error_message = str(e.msg) if hasattr(e, 'msg') and e.msg else str(e)
+
+        # Raise our custom exception with location details
+        raise XMLValidationError(error_message, line=line, column=column)
+
+    except (UnicodeDecodeError, etree.ParseError) as e:
+        # Handle encoding or other parsing errors
+        error_message = f"Failed to parse XML: {str(e)}"
+        raise XMLValidationError(error_message)
+
+
+def iterparse_xml(source: Union[bytes, BinaryIO], tag: str, max_size: Optional[int] = None) -> Iterator[tuple]:
+    """
+    Parse XML incrementally, yielding start and end events for one tag.
+
+    Bytes and binary streams are fed to an lxml pull parser in STREAM_CHUNK_SIZE
+    pieces, so the caller can process each matching element as soon as its end
+    event arrives and then clear it (and its already-processed siblings) to keep
+    the in-memory tree small. Tag filtering happens inside libxml2; only events
+    for matching elements reach Python.
+
+    Args:
+        source (bytes or BinaryIO): XML document bytes or a readable binary stream
+        tag (str): Element tag to report, in lxml notation ("item" for no
+            namespace, "{uri}item" for a namespaced element)
+        max_size (int, optional): Maximum number of bytes to read from a stream.
+            If exceeded, FileSizeExceededError is raised. No limit when None.
+
+    Yields:
+        tuple: (event, element) pairs where event is 'start' or 'end'
+
+    Raises:
+        XMLValidationError: If XML is malformed or invalid, includes
+            error message and location (line/column) information
+        FileSizeExceededError: If the stream yields more than max_size bytes
+
+    Example:
+        for event, element in iterparse_xml(request.stream, "item"):
+            if event == 'end':
+                handle(element)
+                element.clear(keep_tail=True)
+    """
+    is_stream = hasattr(source, 'read')
+    if not is_stream:
+        source = BytesIO(source)
+    # Same security settings as the other parsers; huge_tree only for streamed
+    # (large) bodies, matching parse_xml_stream and parse_xml respectively
+    parser = etree.XMLPullParser(
+        events=('start', 'end'),
+        tag=tag,
+        resolve_entities=False,
+        huge_tree=is_stream,
+        no_network=True,
+        load_dtd=False,
+        collect_ids=False
+    )
+
+    try:
+        bytes_read = 0
+        while True:
+            chunk = source.read(STREAM_CHUNK_SIZE)
+            if not chunk:
+                break
+            bytes_read += len(chunk)
+            if max_size is not None and bytes_read > max_size:
+                raise FileSizeExceededError(
+                    f"Request size exceeds maximum limit of {max_size} bytes",
+                    max_size_bytes=max_size,
+                    actual_size_bytes=bytes_read
+                )
+            parser.feed(chunk)
+            yield from parser.read_events()
+
+        if bytes_read == 0:
+            raise XMLValidationError("Empty XML document")
+
+        parser.close()
+        yield from parser.read_events()
+
+    except etree.XMLSyntaxError as e:
+        # Extract error location information from lxml exception
+        line = e.lineno if hasattr(e, 'lineno') and e.lineno is not None else None
+        column = e.offset if hasattr(e, 'offset') and e.offset is not None else None
+
+        # Extract error message from lxml exception
+        error_message = str(e.msg) if hasattr(e, 'msg') and e.msg else str(e)
+
+        # Raise our custom exception with location details
+        raise XMLValidationError(error_message, line=line, column=column)
+
+    except (UnicodeDecodeError, etree.ParseError) as e:
+        # Handle encoding or other parsing errors
+        error_message = f"Failed to parse XML: {str(e)}"
+        raise XMLValidationError(error_message)
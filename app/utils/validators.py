@@ -5,10 +5,17 @@ This module contains utility functions for request validation
 and standardized error response formatting.
 """
 
-from flask import jsonify, Request
+from functools import lru_cache
+import orjson
+from flask import Request, Response
+from werkzeug.exceptions import RequestEntityTooLarge
+from werkzeug.wsgi import LimitedStream
 from app.exceptions import XMLValidationError, FileSizeExceededError
 from app.config import Config
 
+# Error bodies use the same compact, sorted, newline-terminated form as jsonify()
+_ERROR_JSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+
 
 # Error codes as defined in architecture
 INVALID_CONTENT_TYPE = "INVALID_CONTENT_TYPE"
@@ -34,7 +41,7 @@ def format_error_response(code: str, message: str, details: str = None, status_c
         status_code (int): HTTP status code (default: 400)
 
     Returns:
-        tuple: Flask response tuple (jsonify result, status code)
+        tuple: Flask response tuple (Response, status code)
 
     Example:
         response, status = format_error_response(
@@ -54,7 +61,51 @@ def format_error_response(code: str, message: str, details: str = None, status_c
     if details:
         error_data["error"]["details"] = details
 
-    return jsonify(error_data), status_code
+    return Response(orjson.dumps(error_data, option=_ERROR_JSON_OPTIONS), mimetype='application/json'), status_code
+
+
+@lru_cache(maxsize=64)
+def _static_error_body(code: str, message: str, details: str = None) -> bytes:
+    """Serialize a constant error payload once, in the same compact sorted form as jsonify()."""
+    error_data = {
+        "error": {
+            "code": code,
+            "message": message
+        }
+    }
+    if details:
+        error_data["error"]["details"] = details
+    return orjson.dumps(error_data, option=_ERROR_JSON_OPTIONS)
+
+
+def format_static_error_response(code: str, message: str, details: str = None, status_code: int = 400):
+    """
+    Format an error response whose payload never varies between requests.
+
+    Same response format as format_error_response(), but the JSON body is
+    serialized once per distinct payload and reused, so repeated rejections
+    (oversized uploads, empty bodies, missing parameters) skip the dict
+    building and JSON encoding. Only use it with constant arguments: the
+    cache is keyed by them.
+
+    Args:
+        code (str): Error code (e.g., "EMPTY_REQUEST_BODY")
+        message (str): Human-readable error message
+        details (str, optional): Additional error context
+        status_code (int): HTTP status code (default: 400)
+
+    Returns:
+        tuple: Flask response tuple (Response, status code)
+
+    Example:
+        return format_static_error_response(
+            EMPTY_REQUEST_BODY,
+            "Request body is empty",
+            "XML content is required in the request body"
+        )
+    """
+    body = _static_error_body(code, message, details)
+    return Response(body, mimetype='application/json'), status_code
 
 
 def format_xml_validation_error(error: XMLValidationError) -> tuple:
@@ -68,7 +119,7 @@ def format_xml_validation_error(error: XMLValidationError) -> tuple:
         error (XMLValidationError): The XML validation error to format
 
     Returns:
-        tuple: Flask response tuple (jsonify result, HTTP 400 status code)
+        tuple: Flask response tuple (Response, HTTP 400 status code)
 
     Example:
         try:
@@ -99,7 +150,7 @@ def format_content_type_error(received_content_type: str = None) -> tuple:
         received_content_type (str, optional): The Content-Type value that was received
 
     Returns:
-        tuple: Flask response tuple (jsonify result, HTTP 400 status code)
+        tuple: Flask response tuple (Response, HTTP 400 status code)
     """
     details = f"Received Content-Type: {received_content_type or 'missing'}"
     return format_error_response(
@@ -118,9 +169,9 @@ def format_file_size_error(max_size_mb: int = 300) -> tuple:
         max_size_mb (int): Maximum file size in MB (default: 300)
 
     Returns:
-        tuple: Flask response tuple (jsonify result, HTTP 413 status code)
+        tuple: Flask response tuple (Response, HTTP 413 status code)
     """
-    return format_error_response(
+    return format_static_error_response(
         code=FILE_SIZE_EXCEEDED,
         message=f"Request size exceeds maximum limit of {max_size_mb}MB",
         details=f"Maximum allowed size is {max_size_mb}MB (314572800 bytes)",
@@ -139,9 +190,9 @@ def format_server_error(detailed_message: str = None) -> tuple:
         detailed_message (str, optional): Detailed error message for logging
 
     Returns:
-        tuple: Flask response tuple (jsonify result, HTTP 500 status code)
+        tuple: Flask response tuple (Response, HTTP 500 status code)
     """
-    return format_error_response(
+    return format_static_error_response(
         code=SERVER_ERROR,
         message="An unexpected error occurred during conversion",
         details="Internal server error",
@@ -154,9 +205,12 @@ def validate_request_size(request: Request, max_size: int = None) -> None:
     Validate that request size does not exceed the maximum allowed limit.
 
     This function checks the request size before processing to prevent resource
-    exhaustion. It first checks the Content-Length header if present, and if
-    not available, reads the request body stream to check size. Validation
-    should occur early in the request handling pipeline, before XML parsing.
+    exhaustion. It first checks the Content-Length header if present. If not
+    available, the request stream is wrapped so the limit is enforced while the
+    route handler reads the body: an oversized body then raises
+    RequestEntityTooLarge from request.get_data() instead of being read twice.
+    Validation should occur early in the request handling pipeline, before XML
+    parsing.
 
     Args:
         request (Request): Flask request object to validate
@@ -164,7 +218,8 @@ def validate_request_size(request: Request, max_size: int = None) -> None:
             If not provided, uses Config.MAX_FILE_SIZE (default: 300MB)
 
     Raises:
-        FileSizeExceededError: If request size exceeds the maximum allowed limit
+        FileSizeExceededError: If the declared request size exceeds the maximum
+            allowed limit
 
     Example:
         try:
@@ -205,26 +260,40 @@ def validate_request_size(request: Request, max_size: int = None) -> None:
         # Size is within limit, return early
         return
 
-    # Priority 3: Content-Length not available - must read body to check size
-    # Flask caches request data by default, so multiple calls to get_data() are safe
-    # However, for large files, this will read the entire body into memory
-    # This is acceptable because we need to reject oversized requests early
-    try:
-        body_data = request.get_data(cache=True)  # cache=True allows re-reading by route handler
-        
-        if len(body_data) > max_size:
-            raise FileSizeExceededError(
-                f"Request size ({len(body_data)} bytes) exceeds maximum limit of {max_size} bytes",
-                max_size_bytes=max_size,
-                actual_size_bytes=len(body_data)
-            )
-    except FileSizeExceededError:
-        # Re-raise FileSizeExceededError
-        raise
-    except Exception as e:
-        # If we can't read the request body for size checking (e.g., streaming error),
-        # we allow it through rather than blocking valid requests
-        # In production, you might want to log this and handle differently
-        # For now, we assume if we can't determine size, we allow the request
-        pass
+    # Priority 3: Content-Length not available (chunked upload) - the size is only
+    # known once the body is read, so enforce the limit during the route handler's
+    # single read instead of buffering the whole body here just to measure it.
+    # Without wsgi.input_terminated Werkzeug exposes an empty body, so nothing to wrap
+    environ = request.environ
+    if environ.get('wsgi.input_terminated'):
+        # This replaces Werkzeug's own stream wrapper, so keep MAX_CONTENT_LENGTH too
+        app_limit = request.max_content_length
+        if app_limit is not None and app_limit < max_size:
+            max_size = app_limit
+        request.stream = _MaxSizeStream(environ['wsgi.input'], max_size)
+
+
+class _MaxSizeStream(LimitedStream):
+    """
+    Request body stream that raises once more than max_size bytes arrive.
+
+    Werkzeug's LimitedStream with is_max=True stops quietly at the limit
+    when the body is read in one go, which makes an oversized body look
+    like one exactly at the limit. This variant probes the underlying
+    stream for one more byte once the limit is reached, so the overflow
+    surfaces as RequestEntityTooLarge (HTTP 413) instead of a truncated body.
+    """
+
+    def __init__(self, stream, max_size: int):
+        super().__init__(stream, max_size, is_max=True)
+        self._source = stream
+
+    def readall(self) -> bytes:
+        data = super().readall()
+        if self.is_exhausted:
+            self.on_exhausted()
+        return data
 
+    def on_exhausted(self) -> None:
+        if self._source.read(1):
+            raise RequestEntityTooLarge()
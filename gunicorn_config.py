@@ -5,29 +5,41 @@ This configuration is optimized for handling large XML files (up to 300MB)
 while maintaining good performance and resource utilization.
 """
 
-import multiprocessing
-import os
+from app.config import Config
 
 # Server socket
-bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')
+bind = Config.GUNICORN_BIND
 backlog = 2048
 
 # Worker processes
-# Calculate workers: 2-4 per CPU core as per architecture
-workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
-worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'sync')
+# Workers: (2 * CPU count) + 1 capped at GUNICORN_WORKERS_MAX unless set explicitly
+workers = Config.GUNICORN_WORKERS
+worker_class = Config.GUNICORN_WORKER_CLASS
+# With threads > 1 Gunicorn switches the sync worker to gthread: each worker
+# serves several requests concurrently, overlapping body uploads (I/O) while
+# parsing still runs one request at a time per core
+threads = Config.GUNICORN_THREADS
 worker_connections = 1000
-timeout = int(os.environ.get('GUNICORN_TIMEOUT', 120))  # 120 seconds for large file processing
+timeout = Config.GUNICORN_TIMEOUT  # 120 seconds by default for large file processing
 keepalive = 5
 
 # Graceful timeout for worker lifecycle
-graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
-max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000))
-max_requests_jitter = 50
+graceful_timeout = Config.GUNICORN_GRACEFUL_TIMEOUT
+max_requests = Config.GUNICORN_MAX_REQUESTS
+max_requests_jitter = Config.GUNICORN_MAX_REQUESTS_JITTER
+
+# Application preloading
+# The master imports the app once and workers inherit it via copy-on-write fork,
+# so baseline memory no longer scales with the number of workers.
+# Any per-process resources added later (DB pools, telemetry clients, sockets)
+# must be created in a post_fork() hook, never at import time, so that file
+# descriptors are not shared across workers.
+preload_app = Config.GUNICORN_PRELOAD_APP
 
 # Logging
-loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info').lower()
-accesslog = '-'  # Log to stdout for containerized deployments
+loglevel = Config.GUNICORN_LOG_LEVEL
+# Access log is off by default (DISABLE_ACCESS_LOG): the application logs every request itself
+accesslog = None if Config.DISABLE_ACCESS_LOG else '-'  # stdout for containerized deployments
 errorlog = '-'   # Log to stdout for containerized deployments
 access_log_format = (
     '%(h)s %(l)s %(u)s %(t)s "%(r)s" %(s)s %(b)s "%(f)s" "%(a)s" '
@@ -45,6 +57,7 @@ user = None
 group = None
 tmp_upload_dir = None
 
+
 # SSL (if needed in future)
 # keyfile = None
 # certfile = None
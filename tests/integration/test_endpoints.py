@@ -7,6 +7,7 @@ error handling, and response format.
 
 import pytest
 import csv
+import logging
 from io import StringIO
 from app import create_app
 
@@ -367,3 +368,33 @@ def test_xml_to_csv_endpoint_invalid_delimiter_empty(client):
     assert 'error' in data
     assert data['error']['code'] == 'INVALID_DELIMITER'
 
+
+
+def test_xml_to_csv_endpoint_large_body_is_streamed(client):
+    """Test that a body above the streaming threshold converts the same as a small one."""
+    rows = ''.join(f'<row id="{i}"><name>{"x" * 100}</name></row>' for i in range(12000))
+    xml_data = f'<root>{rows}</root>'  # > 1MB, parsed from request.stream
+    response = client.post(
+        '/convert/xml-to-csv',
+        data=xml_data,
+        content_type='application/xml'
+    )
+    assert response.status_code == 200
+    reader = csv.reader(StringIO(response.data.decode('utf-8')))
+    assert len(list(reader)) == 12001  # header + one row per element
+
+
+def test_success_metrics_skipped_when_info_logging_disabled(client, monkeypatch):
+    """Test that raising the route logger above INFO skips the metrics and RSS readings."""
+    rss_calls = []
+    monkeypatch.setattr('app.routes.convert._rss_mb', lambda: rss_calls.append(1))
+    route_logger = logging.getLogger('app.routes.convert')
+    original_level = route_logger.level
+    route_logger.setLevel(logging.WARNING)
+    try:
+        response = client.post('/convert/xml-to-csv', data='<root><item>1</item></root>', content_type='application/xml')
+    finally:
+        route_logger.setLevel(original_level)
+
+    assert response.status_code == 200
+    assert rss_calls == []
@@ -6,6 +6,7 @@ and returns appropriate error responses with correct HTTP status codes
 and structured error formats.
 """
 
+import io
 import pytest
 from flask import Flask
 from app import create_app
@@ -177,4 +178,56 @@ class TestRequestSizeValidation:
         # Should pass size validation and process successfully
         assert response.status_code != 413
         # If XML is valid, should return 200, otherwise might return 400 for XML errors
-        assert response.status_code in [200, 400]  # Either success or XML parsing error, not size error
\ No newline at end of file
+        assert response.status_code in [200, 400]  # Either success or XML parsing error, not size error
+
+    def test_oversized_request_rejected_before_route_handler(self):
+        """Test that an oversized Content-Length is rejected for every conversion endpoint."""
+        test_app = create_app_with_custom_limit(1000)
+        test_app.config['TESTING'] = True
+        test_client = test_app.test_client()
+
+        large_body = b'<root>' + (b'x' * 2000) + b'</root>'
+
+        for endpoint in ('/convert/xml-to-json', '/convert/xml-to-csv', '/convert/xml-to-csv-xpath?xpath=//item'):
+            response = test_client.post(
+                endpoint,
+                headers={'Content-Type': 'application/xml'},
+                data=large_body
+            )
+            assert response.status_code == 413
+            assert response.json['error']['code'] == 'FILE_SIZE_EXCEEDED'
+
+    def test_chunked_body_over_limit_returns_413(self):
+        """Test that a body sent without Content-Length is limited while it is read."""
+        test_app = create_app_with_custom_limit(1000)
+        test_app.config['TESTING'] = True
+        test_client = test_app.test_client()
+
+        for size, expected_status in ((1000, 200), (1001, 413)):
+            body = b'<root>' + (b'x' * (size - 13)) + b'</root>'
+            response = test_client.post(
+                '/convert/xml-to-json',
+                headers={'Content-Type': 'application/xml', 'Transfer-Encoding': 'chunked'},
+                input_stream=io.BytesIO(body),
+                # Chunked uploads carry no Content-Length; the server marks the body end
+                environ_overrides={'CONTENT_LENGTH': '', 'wsgi.input_terminated': True}
+            )
+            assert response.status_code == expected_status
+        assert response.json['error']['code'] == 'FILE_SIZE_EXCEEDED'
+
+
+def test_unexpected_error_returns_sanitized_500(client, monkeypatch):
+    """Test that an unexpected converter failure is handled once at the blueprint boundary."""
+    def _boom(*args, **kwargs):
+        raise RuntimeError("internal detail")
+
+    monkeypatch.setattr('app.routes.convert.convert_xml_string_to_json', _boom)
+    response = client.post(
+        '/convert/xml-to-json',
+        headers={'Content-Type': 'application/xml'},
+        data='<root><item>test</item></root>'
+    )
+
+    assert response.status_code == 500
+    assert response.json['error']['code'] == 'SERVER_ERROR'
+    assert 'internal detail' not in response.get_data(as_text=True)
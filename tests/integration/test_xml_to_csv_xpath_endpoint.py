@@ -92,6 +92,22 @@ def test_xml_to_csv_xpath_endpoint_with_namespaces(client):
     assert len(rows) == 2
 
 
+def test_xml_to_csv_xpath_endpoint_reuses_parsed_namespaces(client):
+    """Test that repeated namespaces parameters are decoded once into a read-only mapping."""
+    from app.routes.convert import _parse_namespaces
+    xml_data = '<root xmlns:wd="urn:com.workday/bsvc"><wd:Item>a</wd:Item></root>'
+    namespaces = json.dumps({"wd": "urn:com.workday/bsvc"})
+    url = f'/convert/xml-to-csv-xpath?xpath=//wd:Item&namespaces={urllib.parse.quote(namespaces)}'
+    first = client.post(url, data=xml_data, content_type='application/xml')
+    second = client.post(url, data=xml_data, content_type='application/xml')
+    assert first.status_code == second.status_code == 200
+    assert first.data == second.data
+    cached = _parse_namespaces(namespaces)
+    assert cached is _parse_namespaces(namespaces)
+    with pytest.raises(TypeError):
+        cached['wd'] = 'urn:other'
+
+
 def test_xml_to_csv_xpath_endpoint_custom_delimiter(client):
     """Test XPath endpoint with custom delimiter."""
     xml_data = '<root><item id="1"><name>Test</name><value>123</value></item></root>'
@@ -124,6 +140,55 @@ def test_xml_to_csv_xpath_endpoint_invalid_xpath(client):
     assert data['error']['code'] in ['XPATH_ERROR', 'INVALID_XPATH']
 
 
+def test_xml_to_csv_xpath_endpoint_invalid_xpath_rejected_before_body(client):
+    """Test that XPath syntax is checked before the request body is read."""
+    response = client.post(
+        '/convert/xml-to-csv-xpath?xpath=//[invalid',
+        data='',
+        content_type='application/xml'
+    )
+    assert response.status_code == 400
+    assert response.get_json()['error']['code'] == 'INVALID_XPATH'
+
+
+def test_xml_to_csv_xpath_endpoint_evaluation_failure_returns_xpath_error(client):
+    """Test that an XPath that compiles but fails on the document returns XPATH_ERROR."""
+    response = client.post(
+        '/convert/xml-to-csv-xpath?xpath=//wd:item',
+        data='<root><item>test</item></root>',
+        content_type='application/xml'
+    )
+    assert response.status_code == 400
+    assert response.get_json()['error']['code'] == 'XPATH_ERROR'
+
+
+def test_xml_to_csv_xpath_endpoint_scalar_xpath_returns_xpath_error(client):
+    """Test that an XPath returning a number, boolean or string returns XPATH_ERROR."""
+    for xpath in ('count(//item)', 'boolean(//item)', 'name(/*)'):
+        response = client.post(
+            '/convert/xml-to-csv-xpath',
+            query_string={'xpath': xpath},
+            data='<root><item>test</item></root>',
+            content_type='application/xml'
+        )
+        assert response.status_code == 400
+        error = response.get_json()['error']
+        assert error['code'] == 'XPATH_ERROR'
+        assert 'must select nodes' in error['details']
+
+
+def test_xml_to_csv_xpath_endpoint_non_string_namespace_uri_returns_400(client):
+    """Test that namespace mappings with non-string URIs are rejected as INVALID_NAMESPACES."""
+    namespaces = json.dumps({"wd": 1})
+    response = client.post(
+        f'/convert/xml-to-csv-xpath?xpath=//wd:item&namespaces={urllib.parse.quote(namespaces)}',
+        data='<root/>',
+        content_type='application/xml'
+    )
+    assert response.status_code == 400
+    assert response.get_json()['error']['code'] == 'INVALID_NAMESPACES'
+
+
 def test_xml_to_csv_xpath_endpoint_no_matches_returns_empty(client):
     """Test that XPath with no matches returns empty CSV."""
     xml_data = '<root><item>test</item></root>'
@@ -166,3 +231,18 @@ def test_xml_to_csv_xpath_endpoint_complex_structure(client):
     # Verify metadata is not in the CSV
     assert 'version' not in rows[0].keys()
 
+
+
+def test_xml_to_csv_xpath_endpoint_large_body_is_streamed(client):
+    """Test that a body above the streaming threshold is converted from the request stream."""
+    items = ''.join(f'<item id="{i}"><name>{"x" * 100}</name></item>' for i in range(12000))
+    xml_data = f'<root><header>meta</header><items>{items}</items></root>'  # > 1MB
+    response = client.post(
+        '/convert/xml-to-csv-xpath?xpath=//item',
+        data=xml_data,
+        content_type='application/xml'
+    )
+    assert response.status_code == 200
+    lines = response.data.decode('utf-8').strip().split('\n')
+    assert len(lines) == 12001  # header + one row per matched item
+    assert 'meta' not in response.data.decode('utf-8')
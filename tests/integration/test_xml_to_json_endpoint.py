@@ -76,6 +76,17 @@ def test_content_type_validation_text_xml(client):
     assert response.status_code == 200
 
 
+def test_content_type_validation_accepts_charset_parameter(client):
+    """Test that a Content-Type with a charset parameter is accepted."""
+    xml_data = '<root><item>test</item></root>'
+    response = client.post(
+        '/convert/xml-to-json',
+        data=xml_data,
+        content_type='application/xml; charset=utf-8'
+    )
+    assert response.status_code == 200
+
+
 def test_content_type_validation_invalid_content_type(client):
     """Test that invalid Content-Type returns 400 error."""
     xml_data = '<root><item>test</item></root>'
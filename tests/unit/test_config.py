@@ -196,3 +196,168 @@ def test_config_uses_default_secret_key():
         import app.config
         importlib.reload(app.config)
 
+
+
+def test_config_gunicorn_preload_app_defaults_to_true():
+    """Test that GUNICORN_PRELOAD_APP is enabled when environment variable is missing."""
+    original_value = os.environ.get('GUNICORN_PRELOAD_APP')
+    try:
+        os.environ.pop('GUNICORN_PRELOAD_APP', None)
+        import importlib
+        import app.config
+        importlib.reload(app.config)
+
+        config = app.config.Config()
+        assert config.GUNICORN_PRELOAD_APP is True
+    finally:
+        if original_value is not None:
+            os.environ['GUNICORN_PRELOAD_APP'] = original_value
+        import importlib
+        import app.config
+        importlib.reload(app.config)
+
+
+def test_config_gunicorn_preload_app_can_be_disabled():
+    """Test that GUNICORN_PRELOAD_APP can be disabled via environment variable."""
+    original_value = os.environ.get('GUNICORN_PRELOAD_APP')
+    try:
+        os.environ['GUNICORN_PRELOAD_APP'] = 'false'
+        import importlib
+        import app.config
+        importlib.reload(app.config)
+
+        config = app.config.Config()
+        assert config.GUNICORN_PRELOAD_APP is False
+    finally:
+        if original_value is not None:
+            os.environ['GUNICORN_PRELOAD_APP'] = original_value
+        else:
+            os.environ.pop('GUNICORN_PRELOAD_APP', None)
+        import importlib
+        import app.config
+        importlib.reload(app.config)
+
+
+def test_config_gunicorn_workers_auto_sizes_from_cpu_count():
+    """Test that GUNICORN_WORKERS resolves 'auto' to (2 * CPU) + 1 capped at GUNICORN_WORKERS_MAX."""
+    original_value = os.environ.get('GUNICORN_WORKERS')
+    try:
+        os.environ['GUNICORN_WORKERS'] = 'auto'
+        import importlib
+        import app.config
+        importlib.reload(app.config)
+
+        config = app.config.Config()
+        expected = min(2 * (os.cpu_count() or 1) + 1, config.GUNICORN_WORKERS_MAX)
+        assert config.GUNICORN_WORKERS == expected
+    finally:
+        if original_value is not None:
+            os.environ['GUNICORN_WORKERS'] = original_value
+        else:
+            os.environ.pop('GUNICORN_WORKERS', None)
+        import importlib
+        import app.config
+        importlib.reload(app.config)
+
+
+def test_config_gunicorn_workers_explicit_override():
+    """Test that an explicit GUNICORN_WORKERS value is used as-is."""
+    original_value = os.environ.get('GUNICORN_WORKERS')
+    try:
+        os.environ['GUNICORN_WORKERS'] = '3'
+        import importlib
+        import app.config
+        importlib.reload(app.config)
+
+        config = app.config.Config()
+        assert config.GUNICORN_WORKERS == 3
+    finally:
+        if original_value is not None:
+            os.environ['GUNICORN_WORKERS'] = original_value
+        else:
+            os.environ.pop('GUNICORN_WORKERS', None)
+        import importlib
+        import app.config
+        importlib.reload(app.config)
+
+
+def test_config_disable_access_log_defaults_to_true():
+    """Test that DISABLE_ACCESS_LOG is enabled when environment variable is missing."""
+    original_value = os.environ.get('DISABLE_ACCESS_LOG')
+    try:
+        os.environ.pop('DISABLE_ACCESS_LOG', None)
+        import importlib
+        import app.config
+        importlib.reload(app.config)
+
+        config = app.config.Config()
+        assert config.DISABLE_ACCESS_LOG is True
+    finally:
+        if original_value is not None:
+            os.environ['DISABLE_ACCESS_LOG'] = original_value
+        import importlib
+        import app.config
+        importlib.reload(app.config)
+
+
+def test_config_access_log_can_be_enabled():
+    """Test that DISABLE_ACCESS_LOG=false keeps the Gunicorn access log."""
+    original_value = os.environ.get('DISABLE_ACCESS_LOG')
+    try:
+        os.environ['DISABLE_ACCESS_LOG'] = 'false'
+        import importlib
+        import app.config
+        importlib.reload(app.config)
+
+        config = app.config.Config()
+        assert config.DISABLE_ACCESS_LOG is False
+    finally:
+        if original_value is not None:
+            os.environ['DISABLE_ACCESS_LOG'] = original_value
+        else:
+            os.environ.pop('DISABLE_ACCESS_LOG', None)
+        import importlib
+        import app.config
+        importlib.reload(app.config)
+
+
+def test_config_gunicorn_threads_from_environment():
+    """Test that GUNICORN_THREADS loads from environment variable (default 1)."""
+    original_value = os.environ.get('GUNICORN_THREADS')
+    try:
+        import importlib
+        import app.config
+        os.environ.pop('GUNICORN_THREADS', None)
+        importlib.reload(app.config)
+        assert app.config.Config().GUNICORN_THREADS == 1
+
+        os.environ['GUNICORN_THREADS'] = '4'
+        importlib.reload(app.config)
+        assert app.config.Config().GUNICORN_THREADS == 4
+    finally:
+        if original_value is not None:
+            os.environ['GUNICORN_THREADS'] = original_value
+        else:
+            os.environ.pop('GUNICORN_THREADS', None)
+        import importlib
+        import app.config
+        importlib.reload(app.config)
+
+
+def test_config_memory_profiling_disabled_by_default():
+    """Test that MEMORY_PROFILING_ENABLED defaults to False when environment variable is missing."""
+    original_value = os.environ.get('MEMORY_PROFILING_ENABLED')
+    try:
+        os.environ.pop('MEMORY_PROFILING_ENABLED', None)
+        import importlib
+        import app.config
+        importlib.reload(app.config)
+
+        config = app.config.Config()
+        assert config.MEMORY_PROFILING_ENABLED is False
+    finally:
+        if original_value is not None:
+            os.environ['MEMORY_PROFILING_ENABLED'] = original_value
+        import importlib
+        import app.config
+        importlib.reload(app.config)
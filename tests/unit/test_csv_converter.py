@@ -7,8 +7,12 @@ namespaces, RFC 4180 compliance, and edge cases.
 
 import pytest
 from pathlib import Path
+from io import BytesIO
 from lxml import etree
-from app.services.csv_converter import convert_xml_to_csv, convert_xml_string_to_csv
+from app.services.csv_converter import (
+    convert_xml_to_csv, convert_xml_to_csv_by_xpath, convert_xml_string_to_csv, convert_xml_string_to_csv_by_xpath,
+    convert_xml_to_csv_chunks, convert_xml_to_csv_chunks_by_xpath, compile_xpath
+)
 from app.services.xml_parser import parse_xml
 from app.exceptions import XMLValidationError
 
@@ -160,6 +164,18 @@ def test_deeply_nested_structure():
     assert 'level' in result.lower()
 
 
+def test_flatten_deeper_than_recursion_limit():
+    """Test that flattening a tree deeper than the recursion limit does not overflow."""
+    import sys
+    root = node = etree.Element('root')
+    for _ in range(sys.getrecursionlimit() + 100):
+        node = etree.SubElement(node, 'level')
+    etree.SubElement(node, 'v').text = '1'
+    etree.SubElement(node, 'v').text = '2'
+    result = convert_xml_to_csv(root)
+    assert result.splitlines() == ['v', '1', '2']
+
+
 # Tests for RFC 4180 compliance (AC: 4)
 
 def test_csv_rfc4180_special_characters(xml_with_special_chars):
@@ -253,6 +269,12 @@ def test_single_element_no_children():
     assert 'text only' in result or 'root' in result.lower()
 
 
+def test_whitespace_only_elements_add_no_columns():
+    """Test that pretty-printed empty elements contribute no rows or columns."""
+    xml = '<root id="7">\n  <wrap>\n    <empty/>\n    <blank>   </blank>\n  </wrap>\n</root>'
+    assert convert_xml_string_to_csv(xml).splitlines() == ['@id', '7']
+
+
 def test_attributes_only_element():
     """Test edge case: XML with only attributes, no text or children (AC: 6)."""
     xml = '<root><item attr1="val1" attr2="val2"/></root>'
@@ -362,3 +384,140 @@ def test_convert_xml_string_to_csv_wrapper():
     result = convert_xml_string_to_csv(xml_str)
     assert isinstance(result, str)
 
+
+# Tests for stream conversion
+
+def test_convert_xml_to_csv_chunks_from_stream_same_result_as_string():
+    """Test that chunked conversion of a stream produces same CSV as string conversion."""
+    xml = '<root><row id="1"><name>A</name></row><row id="2"><name>B</name></row></root>'
+    row_count, chunks = convert_xml_to_csv_chunks(BytesIO(xml.encode('utf-8')), delimiter=';')
+    assert row_count == 2
+    assert ''.join(chunks) == convert_xml_string_to_csv(xml, delimiter=';')
+
+
+def test_convert_xml_to_csv_chunks_malformed_stream_raises_error():
+    """Test that chunked conversion raises XMLValidationError for a malformed stream."""
+    with pytest.raises(XMLValidationError):
+        convert_xml_to_csv_chunks(BytesIO(b'<root><unclosed>'))
+
+
+def test_convert_xml_to_csv_by_xpath_reuses_compiled_xpath():
+    """Test that repeated XPath conversions reuse the cached compiled expression."""
+    from app.services.csv_converter import _compile_xpath
+    xml = '<root><item id="1"/><item id="2"/></root>'
+    convert_xml_string_to_csv_by_xpath(xml, '//item[@id]')
+    hits_before = _compile_xpath.cache_info().hits
+    result = convert_xml_string_to_csv_by_xpath(xml, '//item[@id]')
+    assert _compile_xpath.cache_info().hits == hits_before + 1
+    assert result.strip().split('\r\n') == ['item/@id', '1', '2']
+
+
+def test_convert_xml_to_csv_chunks_by_xpath_accepts_compiled_xpath():
+    """Test that a precompiled evaluator is accepted and is shared via the cache."""
+    namespaces = {'ns': 'http://example.com/ns'}
+    evaluator = compile_xpath('//ns:item', namespaces)
+    assert compile_xpath('//ns:item', dict(namespaces)) is evaluator
+    xml = b'<root xmlns:ns="http://example.com/ns"><ns:item>a</ns:item><ns:item>b</ns:item></root>'
+    row_count, chunks = convert_xml_to_csv_chunks_by_xpath(xml, evaluator)
+    assert row_count == 2
+    assert ''.join(chunks) == convert_xml_string_to_csv_by_xpath(xml, '//ns:item', namespaces=namespaces)
+
+
+def test_compile_xpath_invalid_expression_raises_validation_error():
+    """Test that compile_xpath reports syntax errors as XMLValidationError."""
+    with pytest.raises(XMLValidationError, match="Invalid XPath"):
+        compile_xpath('//[')
+
+
+# Tests for chunked CSV output
+
+def test_convert_xml_to_csv_chunks_matches_string_output():
+    """Test that joined chunks equal the string conversion, across several chunks."""
+    rows = ''.join(f'<row id="{i}"><name>{"n" * 50}</name></row>' for i in range(5000))
+    xml = f'<root>{rows}</root>'
+    row_count, chunks = convert_xml_to_csv_chunks(xml.encode('utf-8'))
+    chunks = list(chunks)
+    assert row_count == 5000
+    assert len(chunks) > 1
+    assert ''.join(chunks) == convert_xml_string_to_csv(xml)
+
+
+def test_convert_xml_to_csv_chunks_by_xpath_from_stream():
+    """Test that XPath chunk conversion accepts a stream and reports the row count."""
+    xml = b'<root><header>h</header><items><item id="1"/><item id="2"/></items></root>'
+    row_count, chunks = convert_xml_to_csv_chunks_by_xpath(BytesIO(xml), '//item')
+    assert row_count == 2
+    assert ''.join(chunks) == convert_xml_string_to_csv_by_xpath(xml, '//item')
+
+
+def test_convert_xml_to_csv_chunks_by_xpath_simple_path_matches_xpath_engine():
+    """Test that name-only XPaths (incremental parse) give the same rows as a full XPath evaluation."""
+    xml = (b'<root><item id="1"><item>inner</item><name>a</name></item>'
+           b'<group><item>2</item></group><other>x</other><item id="3"/></root>')
+    row_count, chunks = convert_xml_to_csv_chunks_by_xpath(BytesIO(xml), '//item')
+    expected = convert_xml_to_csv_by_xpath(parse_xml(xml), '//item')
+    assert row_count == 4
+    assert ''.join(chunks) == expected
+
+
+def test_convert_xml_to_csv_chunks_by_xpath_simple_prefixed_path():
+    """Test the name-only fast path for a prefixed XPath with explicit namespaces."""
+    namespaces = {'wd': 'urn:com.workday/bsvc'}
+    xml = (b'<wd:Root xmlns:wd="urn:com.workday/bsvc">'
+           b'<wd:Job wd:ID="1"><wd:Name>A</wd:Name></wd:Job><Job>plain</Job>'
+           b'<wd:Job wd:ID="2"><wd:Name>B</wd:Name></wd:Job></wd:Root>')
+    row_count, chunks = convert_xml_to_csv_chunks_by_xpath(xml, '//wd:Job', namespaces=namespaces)
+    assert row_count == 2
+    assert ''.join(chunks) == convert_xml_to_csv_by_xpath(parse_xml(xml), '//wd:Job', namespaces=namespaces)
+
+
+def test_convert_xml_to_csv_by_xpath_name_only_uses_document_order():
+    """Test that a name-only XPath on a parsed tree matches the XPath engine, including nesting."""
+    root = parse_xml('<root><item id="1"><item>inner</item></item><group><item>2</item></group></root>')
+    expected = convert_xml_to_csv_by_xpath(root, '//item[true()]')
+    assert convert_xml_to_csv_by_xpath(root, '//item') == expected
+    # An absolute path searches the whole document even from a subelement
+    assert convert_xml_to_csv_by_xpath(root[1], '//item') == expected
+
+
+def test_convert_xml_to_csv_chunks_raises_before_iteration():
+    """Test that malformed XML raises when called, not when chunks are consumed."""
+    with pytest.raises(XMLValidationError):
+        convert_xml_to_csv_chunks(b'<root><unclosed>')
+
+
+
+def test_split_tag_handles_clark_prefixed_and_plain_tags():
+    """Test that tag splitting covers all tag notations and is cached per tag string."""
+    from app.services.csv_converter import _split_tag
+    assert _split_tag('{urn:x}item') == ('item', None, True)
+    assert _split_tag('p:item') == ('item', 'p', False)
+    assert _split_tag('item') == ('item', None, False)
+    hits_before = _split_tag.cache_info().hits
+    _split_tag('{urn:x}item')
+    assert _split_tag.cache_info().hits == hits_before + 1
+
+
+def test_iter_csv_chunks_releases_rows_as_written():
+    """Test that CSV chunk rendering empties the row list as rows are written."""
+    from app.services.csv_converter import _iter_csv_chunks
+    rows = [{'a': '1'}, {'b': '2'}, {'a': '3', 'b': '4'}]
+    assert ''.join(_iter_csv_chunks(rows, ',')).splitlines() == ['a,b', '1,', ',2', '3,4']
+    assert rows == []
+
+
+def test_namespace_prefixes_resolved_from_document_root():
+    """Test that attribute prefixes come from the root nsmap, first declaration winning."""
+    from app.services.csv_converter import _namespace_prefixes
+    root = parse_xml(b'<r xmlns="urn:d" xmlns:a="urn:x" xmlns:b="urn:x"><i a:k="1"/></r>')
+    uri_to_prefix = _namespace_prefixes(root[0])
+    assert uri_to_prefix['urn:d'] is None
+    assert uri_to_prefix['urn:x'] == 'a'
+    assert uri_to_prefix.get('urn:missing') is None
+
+
+def test_split_attr_handles_namespaced_and_plain_attributes():
+    """Test that attribute names split into (local name, namespace URI)."""
+    from app.services.csv_converter import _split_attr
+    assert _split_attr('{urn:x}ID') == ('ID', 'urn:x')
+    assert _split_attr('id') == ('id', None)
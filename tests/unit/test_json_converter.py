@@ -8,7 +8,10 @@ hierarchy, data types, and handling edge cases.
 import pytest
 from pathlib import Path
 from lxml import etree
-from app.services.json_converter import convert_xml_to_json, convert_xml_string_to_json
+from io import BytesIO
+from app.services.json_converter import (
+    convert_xml_to_json, convert_xml_string_to_json, convert_xml_stream_to_json, _preserve_data_types
+)
 from app.services.xml_parser import parse_xml
 from app.exceptions import XMLValidationError
 
@@ -521,3 +524,78 @@ def test_convert_xml_string_to_json_wraps_unexpected_errors():
         convert_xml_string_to_json(invalid_xml)
 
 
+# Tests for convert_xml_stream_to_json
+
+def test_convert_xml_stream_to_json_same_result_as_string():
+    """Test that stream conversion produces same result as string conversion."""
+    xml = '<root xmlns:ns="http://example.com"><ns:child id="1">content</ns:child><item>a</item><item>b</item></root>'
+    result_stream = convert_xml_stream_to_json(BytesIO(xml.encode('utf-8')))
+    result_string = convert_xml_string_to_json(xml)
+    assert result_stream == result_string
+
+
+def test_convert_xml_stream_to_json_malformed_raises_error():
+    """Test that stream conversion raises XMLValidationError for malformed XML."""
+    with pytest.raises(XMLValidationError):
+        convert_xml_stream_to_json(BytesIO(b'<root><unclosed>'))
+
+
+def test_convert_xml_to_json_deeper_than_recursion_limit():
+    """Test that trees deeper than the recursion limit convert without RecursionError."""
+    import sys
+    depth = sys.getrecursionlimit() + 100
+    root = node = etree.Element('root')
+    for _ in range(depth):
+        node = etree.SubElement(node, 'level')
+    node.text = 'leaf'
+    current = convert_xml_to_json(root)['root']
+    for _ in range(depth):
+        current = current['level']
+    assert current == {'_text': 'leaf'}
+
+
+def test_split_tag_is_cached_per_tag_string():
+    """Test that tag splitting covers all notations and is cached per tag string."""
+    from app.services.json_converter import _split_tag
+    assert _split_tag('{urn:x}item') == ('item', None, True)
+    assert _split_tag('p:item') == ('item', 'p', False)
+    assert _split_tag('item') == ('item', None, False)
+    hits_before = _split_tag.cache_info().hits
+    _split_tag('{urn:x}item')
+    assert _split_tag.cache_info().hits == hits_before + 1
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("42", 42), ("-7", -7), ("+5", 5), ("0", 0),
+    ("007", "007"), ("-01", "-01"),
+    ("1.5", 1.5), ("01.5", 1.5), (".5", 0.5), ("1e3", 1000.0),
+    ("true", True), ("FALSE", False),
+    ("nan", "nan"), ("inf", "inf"), ("1.2.3", "1.2.3"), ("", ""),
+    # int()/float() spellings: surrounding whitespace, "_" separators, Unicode digits
+    (" 5", 5), ("5 ", 5), ("\t7\n", 7), (" 1.5 ", 1.5),
+    ("1_000", 1000), ("١٢", 12), ("٣.٥", 3.5), (" true ", " true "),
+])
+def test_preserve_data_types_classifies_text(text, expected):
+    """Test that text is typed as int/float/bool only when it reads as one."""
+    value = _preserve_data_types(text)
+    assert value == expected
+    assert type(value) is type(expected)
+
+
+def test_prefixed_namespace_declared_only_on_declaring_element():
+    """Test that _xmlns:prefix appears on the declaring element, not on descendants."""
+    result = convert_xml_string_to_json('<a xmlns:x="u"><b/><c xmlns:x="v"/></a>')
+
+    assert result["a"]["_xmlns:x"] == "u"
+    assert "_xmlns:x" not in result["a"]["b"]
+    # Redeclaring the prefix with another URI is a new declaration
+    assert result["a"]["c"]["_xmlns:x"] == "v"
+
+
+def test_namespace_prefixes_share_one_string():
+    """Test that repeated element and attribute prefixes reuse a single string object."""
+    result = convert_xml_string_to_json('<wd:r xmlns:wd="u"><wd:i wd:k="1"/><wd:i wd:k="2"/></wd:r>')
+
+    first, second = result["r"]["i"]
+    assert first["_prefix"] is second["_prefix"]
+    assert first["k"]["_prefix"] is second["k"]["_prefix"]
@@ -0,0 +1,51 @@
+"""
+Unit tests for the structured JSON log formatter.
+
+Tests verify that log records are rendered as single-line JSON with the
+standard fields, extra context keys, and merged structured payloads.
+"""
+
+import json
+import logging
+from app.logging_json import StructuredJSONFormatter, KeyValueFormatter
+
+
+def _make_record(msg, *args, **extra):
+    record = logging.LogRecord('app.test', logging.INFO, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_formatter_emits_standard_fields():
+    """Test that the formatter emits timestamp, level, logger and message."""
+    output = StructuredJSONFormatter().format(_make_record("Hello %s", "world"))
+    entry = json.loads(output)
+    assert entry['level'] == 'INFO'
+    assert entry['logger'] == 'app.test'
+    assert entry['message'] == 'Hello world'
+    assert entry['timestamp'].endswith('Z')
+    assert '\n' not in output
+
+
+def test_formatter_includes_extra_endpoint():
+    """Test that known extra keys are copied into the log entry."""
+    output = StructuredJSONFormatter().format(_make_record("msg", endpoint='/convert/xml-to-json'))
+    assert json.loads(output)['endpoint'] == '/convert/xml-to-json'
+
+
+def test_formatter_merges_payload_into_top_level():
+    """Test that an extra payload dict is merged into the top-level entry."""
+    payload = {'endpoint': '/convert/xml-to-csv', 'processing_ms': 12, 'status': 'success'}
+    entry = json.loads(StructuredJSONFormatter().format(_make_record("Conversion successful", payload=payload)))
+    assert entry['processing_ms'] == 12
+    assert entry['status'] == 'success'
+    assert 'payload' not in entry
+
+
+def test_key_value_formatter_renders_payload_pairs():
+    """Test that the development formatter appends the payload as key=value pairs."""
+    formatter = KeyValueFormatter('%(message)s%(payload_text)s')
+    payload = {'endpoint': '/convert/xml-to-json', 'processing_ms': 3}
+    output = formatter.format(_make_record("Conversion successful", payload=payload))
+    assert output == 'Conversion successful: endpoint=/convert/xml-to-json, processing_ms=3'
+    assert formatter.format(_make_record("plain")) == 'plain'
@@ -8,9 +8,13 @@ body size validation, boundary conditions, and error handling.
 
 import pytest
 from unittest.mock import Mock, MagicMock
+import io
 from flask import Request
+from werkzeug.exceptions import RequestEntityTooLarge
 from app import create_app
-from app.utils.validators import validate_request_size, format_file_size_error
+from app.utils.validators import (
+    validate_request_size, format_file_size_error, format_error_response, format_static_error_response
+)
 from app.exceptions import FileSizeExceededError
 from app.config import Config
 
@@ -23,6 +27,16 @@ def app():
     return app
 
 
+def _chunked_request(body, headers=None):
+    """Build a mock request without Content-Length whose body arrives on wsgi.input."""
+    request = Mock(spec=Request)
+    request.headers = headers or {}
+    request.content_length = None
+    request.max_content_length = None
+    request.environ = {'wsgi.input': io.BytesIO(body), 'wsgi.input_terminated': True}
+    return request
+
+
 class TestValidateRequestSize:
     """Test suite for validate_request_size() function."""
 
@@ -82,15 +96,13 @@ class TestValidateRequestSize:
     def test_content_length_header_invalid_format(self):
         """Test that invalid Content-Length header format falls through to body check."""
         # Create mock request with invalid Content-Length header
-        request = Mock(spec=Request)
-        request.headers = {'Content-Length': 'invalid'}
-        request.content_length = None
-        request.get_data = Mock(return_value=b'x' * 1000)  # Small body, should pass
+        request = _chunked_request(b'x' * 1000, headers={'Content-Length': 'invalid'})
         
         # Should not raise exception (falls through to body check)
         validate_request_size(request)
-        # Verify get_data was called (indicating fallback to body check)
-        request.get_data.assert_called_once_with(cache=True)
+        # The body is not read here; the stream is wrapped for the route's single read
+        request.get_data.assert_not_called()
+        assert request.stream.read() == b'x' * 1000
 
     def test_request_content_length_attribute_within_limit(self):
         """Test that request.content_length attribute within limit passes validation."""
@@ -119,62 +131,47 @@ class TestValidateRequestSize:
         assert exc_info.value.actual_size_bytes == exceeded_size
 
     def test_body_size_within_limit(self):
-        """Test that request body within limit passes validation."""
+        """Test that request body within limit is read in full."""
         # Create mock request without Content-Length header
-        request = Mock(spec=Request)
-        request.headers = {}  # No Content-Length header
-        request.content_length = None
-        request.get_data = Mock(return_value=b'x' * 1000000)  # 1MB body
+        request = _chunked_request(b'x' * 1000000)  # 1MB body
         
-        # Should not raise exception
+        # Should not raise exception, and the route's read gets the whole body
         validate_request_size(request)
-        request.get_data.assert_called_once_with(cache=True)
+        assert request.stream.read() == b'x' * 1000000
+        request.get_data.assert_not_called()
 
     def test_body_size_exceeds_limit(self):
-        """Test that request body exceeding limit raises FileSizeExceededError."""
-        # Create mock request without Content-Length header
-        request = Mock(spec=Request)
-        max_size = Config.MAX_FILE_SIZE  # 300MB = 314572800 bytes
-        exceeded_size = max_size + 1
-        request.headers = {}  # No Content-Length header
-        request.content_length = None
-        request.get_data = Mock(return_value=b'x' * exceeded_size)  # Body exceeding limit
-        
-        # Should raise FileSizeExceededError
-        with pytest.raises(FileSizeExceededError) as exc_info:
-            validate_request_size(request)
-        
-        assert exc_info.value.max_size_bytes == max_size
-        assert exc_info.value.actual_size_bytes == exceeded_size
+        """Test that reading a body exceeding the limit raises RequestEntityTooLarge."""
+        request = _chunked_request(b'x' * 2000)
+
+        validate_request_size(request, max_size=1000)
+        with pytest.raises(RequestEntityTooLarge):
+            request.stream.read()
 
     def test_body_size_exactly_at_limit(self):
         """Test that request body exactly at limit passes validation."""
-        # Create mock request without Content-Length header
-        request = Mock(spec=Request)
-        max_size = Config.MAX_FILE_SIZE  # 300MB = 314572800 bytes
-        request.headers = {}  # No Content-Length header
-        request.content_length = None
-        request.get_data = Mock(return_value=b'x' * max_size)  # Body exactly at limit
-        
-        # Should not raise exception (boundary condition: exactly at limit should pass)
-        validate_request_size(request)
+        request = _chunked_request(b'x' * 1000)
+
+        # Boundary condition: exactly at limit should pass
+        validate_request_size(request, max_size=1000)
+        assert request.stream.read() == b'x' * 1000
 
     def test_body_size_one_byte_over_limit(self):
         """Test that request body one byte over limit fails."""
-        # Create mock request without Content-Length header
-        request = Mock(spec=Request)
-        max_size = Config.MAX_FILE_SIZE  # 300MB = 314572800 bytes
-        exceeded_size = max_size + 1
-        request.headers = {}  # No Content-Length header
-        request.content_length = None
-        request.get_data = Mock(return_value=b'x' * exceeded_size)  # Body one byte over limit
-        
-        # Should raise FileSizeExceededError
-        with pytest.raises(FileSizeExceededError) as exc_info:
-            validate_request_size(request)
-        
-        assert exc_info.value.max_size_bytes == max_size
-        assert exc_info.value.actual_size_bytes == exceeded_size
+        request = _chunked_request(b'x' * 1001)
+
+        validate_request_size(request, max_size=1000)
+        with pytest.raises(RequestEntityTooLarge):
+            request.stream.read()
+
+    def test_body_limit_capped_by_max_content_length(self):
+        """Test that the wrapped stream still honours the app's MAX_CONTENT_LENGTH."""
+        request = _chunked_request(b'x' * 600)
+        request.max_content_length = 500
+
+        validate_request_size(request, max_size=1000)
+        with pytest.raises(RequestEntityTooLarge):
+            request.stream.read()
 
     def test_custom_max_size_parameter(self):
         """Test that custom max_size parameter is used when provided."""
@@ -191,18 +188,15 @@ class TestValidateRequestSize:
         assert exc_info.value.max_size_bytes == custom_max_size
         assert exc_info.value.actual_size_bytes == custom_max_size + 1
 
-    def test_body_read_exception_handled_gracefully(self):
-        """Test that exceptions during body read are handled gracefully."""
-        # Create mock request that raises exception when reading body
-        request = Mock(spec=Request)
-        request.headers = {}  # No Content-Length header
-        request.content_length = None
-        request.get_data = Mock(side_effect=Exception("Stream read error"))
-        
-        # Should not raise exception (allows request through if size can't be determined)
-        # This is a design decision: better to allow potentially oversized requests
-        # than to block valid requests due to read errors
+    def test_unterminated_input_left_untouched(self):
+        """Test that the stream is not wrapped when the server gives no end-of-body signal."""
+        # Werkzeug exposes an empty body in this case, so there is nothing to limit
+        request = _chunked_request(b'x' * 1000)
+        request.environ = {'wsgi.input': request.environ['wsgi.input']}
+        original_stream = request.stream
+
         validate_request_size(request)
+        assert request.stream is original_stream
 
     def test_priority_content_length_header_over_body(self):
         """Test that Content-Length header is checked before reading body."""
@@ -251,3 +245,30 @@ class TestFormatFileSizeError:
             assert 'message' in response.json['error']
             assert 'details' in response.json['error']
             assert response.json['error']['code'] == 'FILE_SIZE_EXCEEDED'
+
+
+class TestFormatStaticErrorResponse:
+    """Test suite for format_static_error_response() function."""
+
+    def test_static_error_matches_format_error_response(self, app):
+        """Test that the cached body is identical to the jsonify-based error response."""
+        with app.app_context():
+            static_response, static_status = format_static_error_response(
+                "EMPTY_REQUEST_BODY", "Request body is empty", "XML content is required"
+            )
+            dynamic_response, dynamic_status = format_error_response(
+                "EMPTY_REQUEST_BODY", "Request body is empty", "XML content is required"
+            )
+
+            assert static_status == dynamic_status == 400
+            assert static_response.get_data() == dynamic_response.get_data()
+            assert static_response.mimetype == 'application/json'
+
+    def test_static_error_returns_fresh_response_objects(self, app):
+        """Test that each call returns its own Response so headers can't leak between requests."""
+        with app.app_context():
+            first, _ = format_static_error_response("MISSING_XPATH", "XPath parameter is required")
+            second, _ = format_static_error_response("MISSING_XPATH", "XPath parameter is required")
+
+            assert first is not second
+            assert first.get_data() == second.get_data()
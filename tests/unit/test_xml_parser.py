@@ -8,8 +8,9 @@ and security protections.
 import pytest
 from pathlib import Path
 from lxml import etree
-from app.services.xml_parser import parse_xml, parse_xml_streaming
-from app.exceptions import XMLValidationError
+from io import BytesIO
+from app.services.xml_parser import parse_xml, parse_xml_streaming, parse_xml_stream
+from app.exceptions import XMLValidationError, FileSizeExceededError
 
 
 # Test fixtures for valid XML samples
@@ -485,3 +486,70 @@ def test_parse_xml_streaming_same_result_as_parse_xml():
     assert root_standard[0].tag == root_streaming[0].tag
     assert root_standard[0].get('id') == root_streaming[0].get('id')
 
+
+# Tests for parse_xml_stream (incremental parsing from a binary stream)
+
+def test_parse_xml_stream_same_result_as_parse_xml(nested_xml):
+    """Test that stream parser produces same tree as standard parser."""
+    root_standard = parse_xml(nested_xml)
+    root_stream = parse_xml_stream(BytesIO(nested_xml.encode('utf-8')))
+    assert etree.tostring(root_standard) == etree.tostring(root_stream)
+
+
+def test_parse_xml_stream_malformed_raises_error():
+    """Test that stream parser raises XMLValidationError for malformed XML."""
+    with pytest.raises(XMLValidationError):
+        parse_xml_stream(BytesIO(b'<root><unclosed></root>'))
+
+
+def test_parse_xml_stream_empty_stream_raises_error():
+    """Test that stream parser raises XMLValidationError for an empty stream."""
+    with pytest.raises(XMLValidationError):
+        parse_xml_stream(BytesIO(b''))
+
+
+def test_parse_xml_stream_exceeding_max_size_raises_error():
+    """Test that stream parser stops reading once max_size is exceeded."""
+    xml = b'<root>' + b'<item>value</item>' * 10000 + b'</root>'
+    with pytest.raises(FileSizeExceededError) as exc_info:
+        parse_xml_stream(BytesIO(xml), max_size=1024)
+    assert exc_info.value.max_size_bytes == 1024
+
+
+def test_parse_xml_accepts_bytes():
+    """Test that parse_xml parses raw bytes without a str round-trip."""
+    root = parse_xml('<root><item>héllo</item></root>'.encode('utf-8'))
+    assert root.find('item').text == 'héllo'
+
+
+def test_parse_xml_bytes_honors_declared_encoding():
+    """Test that bytes input is decoded using the XML declaration's encoding."""
+    xml_bytes = '<?xml version="1.0" encoding="ISO-8859-1"?><root>café</root>'.encode('latin-1')
+    root = parse_xml(xml_bytes)
+    assert root.text == 'café'
+
+
+def test_parse_xml_reuses_parser_after_error():
+    """Test that the per-thread parser stays usable after a malformed document."""
+    from app.services.xml_parser import _get_parser
+    assert _get_parser() is _get_parser()
+    with pytest.raises(XMLValidationError):
+        parse_xml('<root><unclosed></root>')
+    root = parse_xml('<root><child>ok</child></root>')
+    assert root.find('child').text == 'ok'
+
+
+def test_iterparse_xml_yields_events_for_tag_only():
+    """Test that iterparse_xml reports start/end events for the requested tag only."""
+    from app.services.xml_parser import iterparse_xml
+    xml = b'<root><item>1</item><other/><item>2</item></root>'
+    events = [(event, element.text) for event, element in iterparse_xml(BytesIO(xml), 'item')]
+    assert [event for event, _ in events] == ['start', 'end', 'start', 'end']
+    assert [text for event, text in events if event == 'end'] == ['1', '2']
+
+
+def test_iterparse_xml_malformed_raises_validation_error():
+    """Test that iterparse_xml raises XMLValidationError for malformed XML."""
+    from app.services.xml_parser import iterparse_xml
+    with pytest.raises(XMLValidationError):
+        list(iterparse_xml(b'<root><item></root>', 'item'))